@@ -6,14 +6,27 @@ Flask Backend Application
 
 from flask import Flask, render_template, request, jsonify, session, redirect, url_for, send_from_directory, make_response
 from flask_sqlalchemy import SQLAlchemy
+import click
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
+from sqlalchemy import or_, func, update, insert, bindparam, inspect, text
+from sqlalchemy.exc import IntegrityError, DataError
 from datetime import datetime, timedelta
 import os
+import math
 import json
+import hashlib
+import mimetypes
+import threading
+import time
 import requests
-from functools import wraps
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from session_store import MemorySessionStore, ServerSideSessionInterface
+import recommendations
+from write_behind import WriteBehindQueue, QueueFull
+from retention import RetentionPolicy, run_retention
 
 # Load environment variables
 load_dotenv()
@@ -36,6 +49,77 @@ else:
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Password hashing
+# - PASSWORD_HASH_METHOD: werkzeug method string, e.g. "scrypt", "scrypt:16384:8:1"
+#   or "pbkdf2:sha256:600000". Existing hashes are upgraded on the next login.
+app.config['PASSWORD_HASH_METHOD'] = os.getenv('PASSWORD_HASH_METHOD', 'scrypt')
+app.config['PASSWORD_SALT_LENGTH'] = int(os.getenv('PASSWORD_SALT_LENGTH', '16'))
+
+# Sessions
+# - Default: signed cookie session
+# - SESSION_STORE=memory: server-side store (revocable), cookie only carries a signed id
+app.config['SESSION_STORE'] = os.getenv('SESSION_STORE', 'cookie')
+app.config['SESSION_TTL_SECONDS'] = int(os.getenv('SESSION_TTL_SECONDS', str(7 * 24 * 3600)))
+if app.config['SESSION_STORE'] == 'memory':
+    app.session_interface = ServerSideSessionInterface(
+        MemorySessionStore(ttl_seconds=app.config['SESSION_TTL_SECONDS'])
+    )
+
+# Client caching for API GETs (seconds). The service worker serves these
+# stale-while-revalidate once max-age has passed.
+app.config['API_CACHE_MAX_AGE'] = {
+    'get_destinations': int(os.getenv('CACHE_MAX_AGE_DESTINATIONS', '300')),
+    'get_destination': int(os.getenv('CACHE_MAX_AGE_DESTINATION', '300')),
+    'get_reviews': int(os.getenv('CACHE_MAX_AGE_REVIEWS', '60')),
+    'get_weather': int(os.getenv('CACHE_MAX_AGE_WEATHER', '600')),
+    'get_destinations_batch': int(os.getenv('CACHE_MAX_AGE_BATCH', '300')),
+}
+
+# Batch destination details
+app.config['BATCH_MAX_IDS'] = int(os.getenv('BATCH_MAX_IDS', '50'))
+app.config['BATCH_REVIEWS_PER_DESTINATION'] = int(os.getenv('BATCH_REVIEWS_PER_DESTINATION', '5'))
+
+# In-process cache for OpenWeather responses (seconds)
+app.config['WEATHER_CACHE_TTL'] = int(os.getenv('WEATHER_CACHE_TTL', '600'))
+
+# Popularity / trending scores (time-decayed booking and review activity)
+# - SCORES_REFRESH_SECONDS > 0 runs the update in a background thread;
+#   otherwise schedule `flask --app app update-scores` (cron, worker, etc.)
+app.config['SCORE_POPULARITY_HALF_LIFE_DAYS'] = float(os.getenv('SCORE_POPULARITY_HALF_LIFE_DAYS', '30'))
+app.config['SCORE_TRENDING_HALF_LIFE_DAYS'] = float(os.getenv('SCORE_TRENDING_HALF_LIFE_DAYS', '3'))
+app.config['SCORE_BOOKING_WEIGHT'] = float(os.getenv('SCORE_BOOKING_WEIGHT', '3.0'))
+app.config['SCORE_REVIEW_WEIGHT'] = float(os.getenv('SCORE_REVIEW_WEIGHT', '1.0'))
+app.config['SCORE_BATCH_SIZE'] = int(os.getenv('SCORE_BATCH_SIZE', '10000'))
+app.config['SCORES_REFRESH_SECONDS'] = int(os.getenv('SCORES_REFRESH_SECONDS', '0'))
+# Rows are only counted once they are this old, so ids committed out of order
+# (a slow transaction holding a lower id) are not skipped by the watermark
+app.config['SCORE_WATERMARK_LAG_SECONDS'] = int(os.getenv('SCORE_WATERMARK_LAG_SECONDS', '300'))
+
+# Personalized recommendations
+app.config['RECOMMENDATIONS_TOP_N'] = int(os.getenv('RECOMMENDATIONS_TOP_N', '12'))
+app.config['RECOMMENDATIONS_TTL'] = int(os.getenv('RECOMMENDATIONS_TTL', '600'))
+app.config['RECOMMENDATIONS_CATALOGUE_TTL'] = int(os.getenv('RECOMMENDATIONS_CATALOGUE_TTL', '900'))
+
+# Write-behind persistence for travel plan saves
+# - WRITE_BEHIND_PLANS=1: /api/plan/save acknowledges immediately and a background
+#   worker group-commits plans; records are journaled locally until committed
+app.config['WRITE_BEHIND_PLANS'] = os.getenv('WRITE_BEHIND_PLANS', '0') == '1'
+app.config['WRITE_BEHIND_JOURNAL_DIR'] = os.getenv('WRITE_BEHIND_JOURNAL_DIR', os.path.join(app.instance_path, 'write-behind'))
+app.config['WRITE_BEHIND_MAX_QUEUE'] = int(os.getenv('WRITE_BEHIND_MAX_QUEUE', '1000'))
+app.config['WRITE_BEHIND_BATCH_SIZE'] = int(os.getenv('WRITE_BEHIND_BATCH_SIZE', '200'))
+app.config['WRITE_BEHIND_FLUSH_INTERVAL_MS'] = int(os.getenv('WRITE_BEHIND_FLUSH_INTERVAL_MS', '50'))
+app.config['WRITE_BEHIND_PUT_TIMEOUT'] = float(os.getenv('WRITE_BEHIND_PUT_TIMEOUT', '1.0'))
+app.config['WRITE_BEHIND_FSYNC'] = os.getenv('WRITE_BEHIND_FSYNC', '0') == '1'
+
+# Data retention (`flask --app app retention`); 0 days disables a policy
+app.config['RETENTION_ARCHIVE_DIR'] = os.getenv('RETENTION_ARCHIVE_DIR', os.path.join(app.instance_path, 'archive'))
+app.config['RETENTION_CHUNK_SIZE'] = int(os.getenv('RETENTION_CHUNK_SIZE', '1000'))
+app.config['RETENTION_PLAN_DAYS'] = int(os.getenv('RETENTION_PLAN_DAYS', '730'))
+app.config['RETENTION_PLAN_COMPACT_DAYS'] = int(os.getenv('RETENTION_PLAN_COMPACT_DAYS', '90'))
+app.config['RETENTION_PLAN_COMPACT_MIN_BYTES'] = int(os.getenv('RETENTION_PLAN_COMPACT_MIN_BYTES', '1024'))
+app.config['RETENTION_BOOKING_DAYS'] = int(os.getenv('RETENTION_BOOKING_DAYS', '0'))
+app.config['RETENTION_REVIEW_DAYS'] = int(os.getenv('RETENTION_REVIEW_DAYS', '0'))
+
 db = SQLAlchemy(app)
 
 # API Keys
@@ -53,6 +137,7 @@ class User(db.Model):
     password_hash = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     preferences = db.Column(db.Text)  # JSON string for user preferences
+    activity_version = db.Column(db.Integer, nullable=False, default=0)  # bumped when recommendations go stale
     
     # Relationships
     bookings = db.relationship('Booking', backref='user', lazy=True, cascade='all, delete-orphan')
@@ -71,6 +156,8 @@ class Destination(db.Model):
     image_url = db.Column(db.String(500))
     rating = db.Column(db.Float, default=0.0)
     popularity = db.Column(db.Integer, default=0)
+    popularity_score = db.Column(db.Float, default=0.0, nullable=False, index=True)  # maintained by update_scores()
+    trending_score = db.Column(db.Float, default=0.0, nullable=False, index=True)
     best_time = db.Column(db.String(200))
     ideal_weather = db.Column(db.String(100))
     description = db.Column(db.Text)
@@ -120,6 +207,7 @@ class TravelPlan(db.Model):
     end_date = db.Column(db.Date)
     route_data = db.Column(db.Text)  # JSON route information
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    write_id = db.Column(db.String(32), unique=True)  # set by write-behind saves, makes replay idempotent
 
 
 class Review(db.Model):
@@ -132,6 +220,48 @@ class Review(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
 
+class ScoreWatermark(db.Model):
+    """Progress of the incremental score job: last rows already counted"""
+    __tablename__ = 'score_watermarks'
+    name = db.Column(db.String(50), primary_key=True)
+    last_booking_id = db.Column(db.Integer, nullable=False, default=0)
+    last_review_id = db.Column(db.Integer, nullable=False, default=0)
+    scored_at = db.Column(db.DateTime)
+
+
+# Columns added after the first release; create_all() won't add them to existing tables
+# (column, DDL, index kind or None)
+SCHEMA_UPGRADES = {
+    'users': [
+        ('activity_version', 'INTEGER NOT NULL DEFAULT 0', None),
+    ],
+    'destinations': [
+        ('popularity_score', 'FLOAT NOT NULL DEFAULT 0', 'index'),
+        ('trending_score', 'FLOAT NOT NULL DEFAULT 0', 'index'),
+    ],
+    'travel_plans': [
+        ('write_id', 'VARCHAR(32)', 'unique'),
+    ],
+}
+
+
+def upgrade_schema():
+    """Add missing columns (and their indexes) to existing tables"""
+    inspector = inspect(db.engine)
+    for table, columns in SCHEMA_UPGRADES.items():
+        if not inspector.has_table(table):
+            continue
+        existing = {c['name'] for c in inspector.get_columns(table)}
+        for column, ddl, index in columns:
+            if column not in existing:
+                db.session.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+                if index is None:
+                    continue
+                unique = 'UNIQUE ' if index == 'unique' else ''
+                db.session.execute(text(f'CREATE {unique}INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})'))
+    db.session.commit()
+
+
 # Helper Functions
 def login_required(f):
     @wraps(f)
@@ -142,6 +272,558 @@ def login_required(f):
     return decorated_function
 
 
+def hash_password(password):
+    """Hash a password with the configured method and salt length"""
+    return generate_password_hash(
+        password,
+        method=app.config['PASSWORD_HASH_METHOD'],
+        salt_length=app.config['PASSWORD_SALT_LENGTH']
+    )
+
+
+@lru_cache(maxsize=8)
+def _hash_prefix(method, salt_length):
+    # werkzeug normalizes the method (e.g. "scrypt" -> "scrypt:32768:8:1"), so
+    # derive the canonical prefix from a real hash rather than parsing it here
+    return generate_password_hash('', method=method, salt_length=salt_length).split('$', 1)[0]
+
+
+def password_needs_rehash(password_hash):
+    """True if a stored hash was made with different parameters than configured"""
+    method = app.config['PASSWORD_HASH_METHOD']
+    salt_length = app.config['PASSWORD_SALT_LENGTH']
+    parts = password_hash.split('$')
+    if len(parts) != 3 or len(parts[1]) != salt_length:
+        return True
+    return parts[0] != _hash_prefix(method, salt_length)
+
+
+# Files under static/ that are not worth precaching
+_ASSET_SKIP = {'sw.js'}
+_asset_manifest = None
+_dist_manifest = None
+
+# Built assets are content-hashed, so they can be cached forever
+DIST_MAX_AGE = 365 * 24 * 3600
+# Precompressed variants written by build_assets.py, in order of preference
+DIST_ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def get_dist_manifest():
+    """Mapping of source asset -> hashed build output, or {} if not built"""
+    global _dist_manifest
+    if _dist_manifest is None or app.debug:
+        path = os.path.join(app.static_folder, 'dist', 'manifest.json')
+        try:
+            with open(path, 'r') as f:
+                _dist_manifest = json.load(f)
+        except (OSError, ValueError):
+            _dist_manifest = {}
+    return _dist_manifest
+
+
+def build_asset_manifest():
+    """Content-hash every static asset.
+
+    Returns {'version', 'hashes': {filename: hash}, 'precache': [url, ...]}.
+    Sources that have a build in static/dist/ are precached by their built
+    URL instead. The version changes whenever any asset or any backend module
+    (the .py files next to app.py) changes, which also changes the service worker script and triggers its
+    update (rolling over the precache and the API response cache).
+    """
+    dist = get_dist_manifest()
+    hashes = {}
+    for root, dirs, files in os.walk(app.static_folder):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        if root == app.static_folder and 'dist' in dirs:
+            dirs.remove('dist')
+        for name in sorted(files):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, app.static_folder).replace(os.sep, '/')
+            if rel in _ASSET_SKIP:
+                continue
+            with open(path, 'rb') as f:
+                hashes[rel] = hashlib.sha256(f.read()).hexdigest()[:12]
+
+    backend = {}
+    for name in sorted(os.listdir(app.root_path)):
+        if name.endswith('.py'):
+            with open(os.path.join(app.root_path, name), 'rb') as f:
+                backend[name] = hashlib.sha256(f.read()).hexdigest()[:12]
+    version = hashlib.sha256(json.dumps([hashes, dist, backend], sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    return {
+        'version': version,
+        'hashes': hashes,
+        'precache': [
+            f"{app.static_url_path}/dist/{dist[rel]}" if rel in dist else f"{app.static_url_path}/{rel}?v={h}"
+            for rel, h in hashes.items()
+        ],
+    }
+
+
+def get_asset_manifest():
+    """Cached asset manifest (rebuilt on every call in debug mode)"""
+    global _asset_manifest
+    if _asset_manifest is None or app.debug:
+        _asset_manifest = build_asset_manifest()
+    return _asset_manifest
+
+
+@app.url_defaults
+def hashed_static_url(endpoint, values):
+    """Append the content hash to url_for('static', ...) so URLs change with content"""
+    if endpoint == 'static' and 'filename' in values and 'v' not in values:
+        digest = get_asset_manifest()['hashes'].get(values['filename'])
+        if digest:
+            values['v'] = digest
+
+
+@app.template_global()
+def asset_url(filename):
+    """URL of a static asset, preferring the minified, hashed build"""
+    built = get_dist_manifest().get(filename)
+    if built:
+        return url_for('dist_asset', filename=built)
+    return url_for('static', filename=filename)
+
+
+@app.after_request
+def cache_headers(response):
+    """Per-endpoint Cache-Control for cacheable API GETs and versioned static files"""
+    if request.method == 'GET' and response.status_code == 200:
+        if request.endpoint == 'static' and request.args.get('v'):
+            # Only the current hash is immutable; an old page asking for ?v=<old hash>
+            # gets the new content, which must not be pinned under the old URL
+            filename = (request.view_args or {}).get('filename')
+            if request.args['v'] == get_asset_manifest()['hashes'].get(filename):
+                response.headers['Cache-Control'] = f'public, max-age={DIST_MAX_AGE}, immutable'
+        else:
+            max_age = app.config['API_CACHE_MAX_AGE'].get(request.endpoint)
+            if max_age:
+                response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+_weather_cache = {}  # (lat, lon) -> (expires_at, data)
+_weather_cache_lock = threading.Lock()
+
+
+def peek_cached_weather_data(lat, lon):
+    """Cached weather for the coordinates, or None without calling the API"""
+    with _weather_cache_lock:
+        entry = _weather_cache.get((round(lat, 3), round(lon, 3)))
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def get_cached_weather_data(lat, lon):
+    """get_weather_data() behind a TTL cache keyed by rounded coordinates"""
+    data = peek_cached_weather_data(lat, lon)
+    if data:
+        return data
+
+    data = get_weather_data(lat, lon)
+    if data:
+        with _weather_cache_lock:
+            _weather_cache[(round(lat, 3), round(lon, 3))] = (
+                time.monotonic() + app.config['WEATHER_CACHE_TTL'], data
+            )
+    return data
+
+
+def weather_summary(dest, weather_data):
+    """Weather fields shown to the client, including suitability for the destination"""
+    temp = weather_data['main']['temp']
+    
+    # Determine suitability
+    suitable = True
+    if dest.ideal_weather:
+        ideal_temp_range = dest.ideal_weather.split('-')
+        if len(ideal_temp_range) == 2:
+            try:
+                min_temp = float(ideal_temp_range[0])
+                max_temp = float(ideal_temp_range[1])
+                suitable = min_temp <= temp <= max_temp
+            except:
+                pass
+    
+    return {
+        'available': True,
+        'temperature': temp,
+        'humidity': weather_data['main']['humidity'],
+        'description': weather_data['weather'][0]['description'],
+        'icon': weather_data['weather'][0]['icon'],
+        'suitable': suitable
+    }
+
+
+def destination_to_dict(d):
+    return {
+        'id': d.id,
+        'name': d.name,
+        'category': d.category,
+        'state': d.state,
+        'latitude': d.latitude,
+        'longitude': d.longitude,
+        'image_url': d.image_url,
+        'rating': d.rating,
+        'popularity': d.popularity,
+        'popularity_score': round(d.popularity_score or 0.0, 4),
+        'trending_score': round(d.trending_score or 0.0, 4),
+        'best_time': d.best_time,
+        'ideal_weather': d.ideal_weather,
+        'description': d.description
+    }
+
+
+def existing_destination_id(value):
+    """Integer id of an existing destination, or None for anything else"""
+    if isinstance(value, bool):
+        return None
+    try:
+        dest_id = int(value)
+    except (TypeError, ValueError):
+        return None
+    if db.session.get(Destination, dest_id) is None:
+        return None
+    return dest_id
+
+
+def _decay_rate(half_life_days):
+    return math.log(2) / half_life_days
+
+
+def _accumulate_activity(scores, rows, weight, now, pop_rate, trend_rate):
+    """Add each event's decayed weight to its destination's running totals"""
+    for dest_id, created_at in rows:
+        age_days = max(0.0, (now - created_at).total_seconds() / 86400.0) if created_at else 0.0
+        entry = scores.setdefault(dest_id, [0.0, 0.0])
+        entry[0] += weight * math.exp(-pop_rate * age_days)
+        entry[1] += weight * math.exp(-trend_rate * age_days)
+
+
+def _iter_new_activity(model, after_id, upto_id, batch_size):
+    """(destination_id, created_at) for rows with after_id < id <= upto_id, in id batches"""
+    start = after_id
+    while start < upto_id:
+        end = min(start + batch_size, upto_id)
+        rows = db.session.query(model.destination_id, model.created_at).filter(
+            model.id > start, model.id <= end, model.destination_id.isnot(None)
+        ).all()
+        yield rows
+        start = end
+
+
+def _settled_max_id(model, after_id, cutoff):
+    """Highest id above after_id whose row was created before cutoff"""
+    settled = db.session.query(func.max(model.id)).filter(
+        model.id > after_id, or_(model.created_at < cutoff, model.created_at.is_(None))
+    ).scalar()
+    return max(after_id, settled or 0)
+
+
+def update_scores(now=None):
+    """Incrementally update Destination.popularity_score and trending_score.
+
+    Scores are exponentially decayed sums of booking/review weights. Each run
+    decays the stored scores by the time since the previous run, then adds the
+    bookings and reviews created after the watermark, so nothing is rescanned.
+    The watermark only moves up to the newest row older than
+    SCORE_WATERMARK_LAG_SECONDS: ids are allocated before commit, so a lower id
+    can become visible after a higher one, and the lag gives slow transactions
+    time to commit before their id range is passed.
+    The watermark is advanced with a compare-and-set in the same transaction,
+    which makes concurrent runs (several workers, cron overlap) safe: only one
+    of them applies. Returns run statistics, or None if another run won.
+    """
+    now = now or datetime.utcnow()
+    pop_rate = _decay_rate(app.config['SCORE_POPULARITY_HALF_LIFE_DAYS'])
+    trend_rate = _decay_rate(app.config['SCORE_TRENDING_HALF_LIFE_DAYS'])
+    batch_size = app.config['SCORE_BATCH_SIZE']
+
+    mark = db.session.get(ScoreWatermark, 'destinations')
+    if mark is None:
+        mark = ScoreWatermark(name='destinations', last_booking_id=0, last_review_id=0)
+        db.session.add(mark)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()
+            mark = db.session.get(ScoreWatermark, 'destinations')
+
+    old_booking_id, old_review_id, last_run = mark.last_booking_id, mark.last_review_id, mark.scored_at
+    cutoff = now - timedelta(seconds=app.config['SCORE_WATERMARK_LAG_SECONDS'])
+    max_booking_id = _settled_max_id(Booking, old_booking_id, cutoff)
+    max_review_id = _settled_max_id(Review, old_review_id, cutoff)
+
+    claimed = db.session.execute(
+        update(ScoreWatermark).where(
+            ScoreWatermark.name == 'destinations',
+            ScoreWatermark.last_booking_id == old_booking_id,
+            ScoreWatermark.last_review_id == old_review_id,
+            ScoreWatermark.scored_at.is_(None) if last_run is None else ScoreWatermark.scored_at == last_run
+        ).values(last_booking_id=max_booking_id, last_review_id=max_review_id, scored_at=now)
+    )
+    if claimed.rowcount != 1:
+        db.session.rollback()
+        return None
+
+    try:
+        # Decay everything already scored by the time since the last run
+        elapsed_days = max(0.0, (now - last_run).total_seconds() / 86400.0) if last_run else 0.0
+        if elapsed_days > 0:
+            db.session.execute(
+                update(Destination).where(
+                    or_(Destination.popularity_score > 0, Destination.trending_score > 0)
+                ).values(
+                    popularity_score=Destination.popularity_score * math.exp(-pop_rate * elapsed_days),
+                    trending_score=Destination.trending_score * math.exp(-trend_rate * elapsed_days)
+                )
+            )
+
+        scores = {}
+        new_bookings = new_reviews = 0
+        for rows in _iter_new_activity(Booking, old_booking_id, max_booking_id, batch_size):
+            _accumulate_activity(scores, rows, app.config['SCORE_BOOKING_WEIGHT'], now, pop_rate, trend_rate)
+            new_bookings += len(rows)
+        for rows in _iter_new_activity(Review, old_review_id, max_review_id, batch_size):
+            _accumulate_activity(scores, rows, app.config['SCORE_REVIEW_WEIGHT'], now, pop_rate, trend_rate)
+            new_reviews += len(rows)
+
+        if scores:
+            table = Destination.__table__
+            db.session.execute(
+                table.update().where(table.c.id == bindparam('dest_id')).values(
+                    popularity_score=table.c.popularity_score + bindparam('pop_delta'),
+                    trending_score=table.c.trending_score + bindparam('trend_delta')
+                ),
+                [{'dest_id': k, 'pop_delta': v[0], 'trend_delta': v[1]} for k, v in scores.items()]
+            )
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    return {
+        'new_bookings': new_bookings,
+        'new_reviews': new_reviews,
+        'destinations_updated': len(scores),
+        'decayed_days': round(elapsed_days, 4),
+    }
+
+
+def _score_refresh_loop(interval):
+    while True:
+        time.sleep(interval)
+        with app.app_context():
+            try:
+                update_scores()
+            except Exception as e:
+                print(f"Score update error: {e}")
+            finally:
+                db.session.remove()
+
+
+@app.cli.command('update-scores')
+def update_scores_command():
+    """Apply new bookings/reviews to popularity and trending scores"""
+    stats = update_scores()
+    if stats is None:
+        print("Another score update is in progress; skipped")
+    else:
+        print(f"Scores updated: {stats}")
+
+
+_catalogue = None
+_catalogue_built_at = 0.0
+_catalogue_lock = threading.Lock()
+recommendation_cache = recommendations.TTLCache(app.config['RECOMMENDATIONS_TTL'])
+
+
+def get_catalogue():
+    """Destination feature arrays, rebuilt after RECOMMENDATIONS_CATALOGUE_TTL.
+
+    Only one request rebuilds; the others keep using the previous catalogue.
+    """
+    global _catalogue, _catalogue_built_at
+    fresh = time.monotonic() - _catalogue_built_at < app.config['RECOMMENDATIONS_CATALOGUE_TTL']
+    if _catalogue is not None and fresh:
+        return _catalogue
+    if _catalogue_lock.acquire(blocking=_catalogue is None):
+        try:
+            if _catalogue is None or time.monotonic() - _catalogue_built_at >= app.config['RECOMMENDATIONS_CATALOGUE_TTL']:
+                rows = db.session.query(
+                    Destination.id, Destination.category, Destination.state,
+                    Destination.rating, Destination.popularity_score, Destination.popularity
+                ).order_by(Destination.id).all()
+                _catalogue = recommendations.Catalogue(rows)
+                _catalogue_built_at = time.monotonic()
+        finally:
+            _catalogue_lock.release()
+    return _catalogue
+
+
+def bump_activity_version(user_id):
+    """Mark a user's cached recommendations stale in every worker.
+
+    Runs in the caller's transaction, so the bump commits with the write.
+    """
+    db.session.execute(
+        update(User).where(User.id == user_id).values(activity_version=User.activity_version + 1)
+    )
+
+
+def get_user_recommendations(user_id):
+    """Cached top-N recommended destinations (as dicts) for a user.
+
+    Entries are keyed on the user's activity_version, which bookings, reviews
+    and preference changes bump in the database, so a write handled by one
+    worker also invalidates what the other workers have cached.
+    """
+    user = db.session.get(User, user_id)
+    if user is None:
+        return []
+    cache_key = (user_id, user.activity_version)
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    booked_ids = [row[0] for row in db.session.query(Booking.destination_id).filter(
+        Booking.user_id == user_id, Booking.destination_id.isnot(None)
+    )]
+    reviews = db.session.query(Review.destination_id, Review.rating).filter(Review.user_id == user_id).all()
+
+    catalogue = get_catalogue()
+    profile = recommendations.build_profile(catalogue, user.preferences, booked_ids, reviews)
+    ranked = recommendations.recommend(
+        catalogue, profile, app.config['RECOMMENDATIONS_TOP_N'], exclude_ids=booked_ids
+    )
+
+    by_id = {d.id: d for d in Destination.query.filter(Destination.id.in_([i for i, _ in ranked])).all()}
+    result = [
+        {**destination_to_dict(by_id[dest_id]), 'score': round(score, 4)}
+        for dest_id, score in ranked if dest_id in by_id
+    ]
+    recommendation_cache.set(cache_key, result)
+    return result
+
+
+_plan_writer = None
+_plan_writer_lock = threading.Lock()
+
+
+def _travel_plan_row(record):
+    """Write-behind record (JSON-safe) -> TravelPlan column values"""
+    def parse_date(value):
+        return datetime.strptime(value, '%Y-%m-%d').date() if value else None
+    return {
+        'user_id': record['user_id'],
+        'destination_ids': record['destination_ids'],
+        'start_date': parse_date(record.get('start_date')),
+        'end_date': parse_date(record.get('end_date')),
+        'route_data': record['route_data'],
+        'created_at': datetime.fromisoformat(record['created_at']),
+        'write_id': record.get('write_id'),
+    }
+
+
+def _flush_travel_plans(records):
+    """Insert a batch of queued plans in one transaction, skipping ones already stored"""
+    with app.app_context():
+        try:
+            write_ids = [r['write_id'] for r in records]
+            stored = {row[0] for row in db.session.query(TravelPlan.write_id).filter(TravelPlan.write_id.in_(write_ids))}
+            rows = [_travel_plan_row(r) for r in records if r['write_id'] not in stored]
+            if rows:
+                db.session.execute(insert(TravelPlan), rows)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            db.session.remove()
+
+
+def get_plan_writer():
+    """Process-wide write-behind queue for travel plans.
+
+    Started at import when WRITE_BEHIND_PLANS is set (replaying journals
+    left by dead processes), otherwise on first use.
+    """
+    global _plan_writer
+    if _plan_writer is None:
+        with _plan_writer_lock:
+            if _plan_writer is None:
+                _plan_writer = WriteBehindQueue(
+                    _flush_travel_plans,
+                    app.config['WRITE_BEHIND_JOURNAL_DIR'],
+                    max_size=app.config['WRITE_BEHIND_MAX_QUEUE'],
+                    batch_size=app.config['WRITE_BEHIND_BATCH_SIZE'],
+                    flush_interval=app.config['WRITE_BEHIND_FLUSH_INTERVAL_MS'] / 1000.0,
+                    put_timeout=app.config['WRITE_BEHIND_PUT_TIMEOUT'],
+                    fsync=app.config['WRITE_BEHIND_FSYNC'],
+                    # Bad record contents, as opposed to the database being unavailable
+                    permanent_errors=(KeyError, TypeError, ValueError, IntegrityError, DataError)
+                )
+                if _plan_writer.recovered:
+                    print(f"Write-behind: recovered {_plan_writer.recovered} journaled travel plans")
+    return _plan_writer
+
+
+def compact_route_data(plan):
+    """Drop route geometry from an old plan, keeping its scalar summary fields"""
+    try:
+        route = json.loads(plan.route_data or '{}')
+    except ValueError:
+        route = {}
+    summary = {k: v for k, v in route.items() if not isinstance(v, (dict, list))} if isinstance(route, dict) else {}
+    summary['compacted'] = True
+    return {'route_data': json.dumps(summary)}
+
+
+def retention_policies():
+    """Retention policies in the order they run (delete before compacting)"""
+    return [
+        RetentionPolicy('travel_plans', TravelPlan, TravelPlan.created_at, app.config['RETENTION_PLAN_DAYS']),
+        RetentionPolicy(
+            'travel_plan_routes', TravelPlan, TravelPlan.created_at, app.config['RETENTION_PLAN_COMPACT_DAYS'],
+            action='compact', compact_fn=compact_route_data,
+            # Only large blobs; compacted rows fall below this and are not picked again
+            extra_filter=func.length(TravelPlan.route_data) > app.config['RETENTION_PLAN_COMPACT_MIN_BYTES']
+        ),
+        RetentionPolicy('bookings', Booking, Booking.created_at, app.config['RETENTION_BOOKING_DAYS']),
+        RetentionPolicy('reviews', Review, Review.created_at, app.config['RETENTION_REVIEW_DAYS']),
+    ]
+
+
+@app.cli.command('retention')
+@click.option('--dry-run', is_flag=True, help='Count matching rows without archiving or deleting')
+@click.option('--no-vacuum', is_flag=True, help='Skip VACUUM/ANALYZE afterwards')
+def retention_command(dry_run, no_vacuum):
+    """Archive old bookings, plans and reviews, compact old routes, then vacuum"""
+    report = run_retention(
+        db,
+        retention_policies(),
+        app.config['RETENTION_ARCHIVE_DIR'],
+        chunk_size=app.config['RETENTION_CHUNK_SIZE'],
+        dry_run=dry_run,
+        vacuum=not no_vacuum
+    )
+    for stats in report['policies']:
+        print(f"{stats['policy']:20s} {stats['action']:8s} {stats['rows']:8d} rows  {stats['archive'] or ''}")
+    if report['reclaimed_bytes'] is not None:
+        print(f"Size: {report['size_before_bytes']} -> {report['size_after_bytes']} bytes "
+              f"(reclaimed {report['reclaimed_bytes']})")
+    elif report['size_before_bytes'] is not None:
+        print(f"Relation size: {report['size_before_bytes']} -> {report['size_after_bytes']} bytes "
+              f"(VACUUM keeps freed space for reuse; it is not returned to the OS)")
+    if report['dead_tuples_removed'] is not None:
+        print(f"Dead row versions removed by VACUUM: {report['dead_tuples_removed']}")
+
+
 def get_weather_data(lat, lon):
     """Fetch weather data from OpenWeather API"""
     if not OPENWEATHER_API_KEY:
@@ -174,16 +856,49 @@ def manifest():
     resp.headers['Content-Type'] = 'application/manifest+json; charset=utf-8'
     return resp
 
+@app.route('/asset-manifest.json')
+def asset_manifest():
+    manifest = get_asset_manifest()
+    resp = jsonify({
+        'version': manifest['version'],
+        'precache': ['/', '/login'] + manifest['precache']
+    })
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
+
 @app.route('/sw.js')
 def service_worker():
-    # Service worker must be served from site root for full scope
-    resp = make_response(send_from_directory('static', 'sw.js'))
+    # Service worker must be served from site root for full scope.
+    # The asset version is baked in so the script changes whenever assets do.
+    with open(os.path.join(app.static_folder, 'sw.js'), 'r') as f:
+        script = f.read().replace('__ASSET_VERSION__', get_asset_manifest()['version'])
+    resp = make_response(script)
     resp.headers['Content-Type'] = 'application/javascript; charset=utf-8'
     # Allow updates without aggressive caching
     resp.headers['Cache-Control'] = 'no-cache'
     return resp
 
 
+@app.route('/static/dist/<path:filename>')
+def dist_asset(filename):
+    """Serve built assets, using a precompressed variant when the client accepts it"""
+    dist_dir = os.path.join(app.static_folder, 'dist')
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    accepted = request.accept_encodings
+
+    for encoding, suffix in DIST_ENCODINGS:
+        if accepted[encoding] and os.path.isfile(os.path.join(dist_dir, filename + suffix)):
+            resp = send_from_directory(dist_dir, filename + suffix, mimetype=mimetype, max_age=DIST_MAX_AGE)
+            resp.headers['Content-Encoding'] = encoding
+            break
+    else:
+        resp = send_from_directory(dist_dir, filename, mimetype=mimetype, max_age=DIST_MAX_AGE)
+
+    resp.headers['Cache-Control'] = f'public, max-age={DIST_MAX_AGE}, immutable'
+    resp.headers['Vary'] = 'Accept-Encoding'
+    return resp
+
+
 @app.route('/login')
 def login_page():
     if 'user_id' in session:
@@ -234,6 +949,19 @@ def login():
     user = User.query.filter_by(email=email).first()
     
     if user and check_password_hash(user.password_hash, password):
+        # Transparently upgrade hashes made with older parameters
+        if password_needs_rehash(user.password_hash):
+            try:
+                user.password_hash = hash_password(password)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                print(f"Password rehash error: {e}")
+
+        # Never carry a pre-login session id over (session fixation)
+        session.clear()
+        if hasattr(session, 'regenerate'):
+            session.regenerate()
         session['user_id'] = user.id
         session['username'] = user.username
         session['email'] = user.email
@@ -259,24 +987,23 @@ def signup():
     if len(password) < 6:
         return jsonify({'success': False, 'message': 'Password must be at least 6 characters'}), 400
     
-    # Check if user exists
-    if User.query.filter_by(email=email).first():
-        return jsonify({'success': False, 'message': 'Email already registered'}), 400
-    
-    if User.query.filter_by(username=username).first():
-        return jsonify({'success': False, 'message': 'Username already taken'}), 400
-    
-    # Create new user
+    # Create new user; the unique constraints on email/username catch duplicates
     user = User(
         username=username,
         email=email,
-        password_hash=generate_password_hash(password)
+        password_hash=hash_password(password)
     )
     
     try:
         db.session.add(user)
         db.session.commit()
         return jsonify({'success': True, 'message': 'Account created successfully'})
+    except IntegrityError:
+        db.session.rollback()
+        existing = User.query.filter(or_(User.email == email, User.username == username)).first()
+        if existing and existing.email == email:
+            return jsonify({'success': False, 'message': 'Email already registered'}), 400
+        return jsonify({'success': False, 'message': 'Username already taken'}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'success': False, 'message': 'Error creating account'}), 500
@@ -305,25 +1032,95 @@ def get_destinations():
         query = query.order_by(Destination.rating.desc())
     elif sort == 'name':
         query = query.order_by(Destination.name)
-    else:  # popularity (default)
-        query = query.order_by(Destination.popularity.desc())
+    elif sort == 'trending':
+        query = query.order_by(Destination.trending_score.desc(), Destination.popularity_score.desc())
+    else:  # popularity (default): activity score, then the curated seed value
+        query = query.order_by(Destination.popularity_score.desc(), Destination.popularity.desc())
     
     destinations = query.all()
     
-    return jsonify([{
-        'id': d.id,
-        'name': d.name,
-        'category': d.category,
-        'state': d.state,
-        'latitude': d.latitude,
-        'longitude': d.longitude,
-        'image_url': d.image_url,
-        'rating': d.rating,
-        'popularity': d.popularity,
-        'best_time': d.best_time,
-        'ideal_weather': d.ideal_weather,
-        'description': d.description
-    } for d in destinations])
+    return jsonify([destination_to_dict(d) for d in destinations])
+
+
+@app.route('/api/destinations/batch')
+def get_destinations_batch():
+    """Details, latest reviews and weather for many destinations in one response.
+
+    ?ids=1,2,3 (at most BATCH_MAX_IDS). Each table is read with a single IN
+    query. Weather is served from the in-process cache only, so the batch never
+    calls OpenWeather; pass weather=fetch to fetch misses concurrently or
+    weather=none to omit it.
+    """
+    raw_ids = request.args.get('ids', '')
+    try:
+        ids = list(dict.fromkeys(int(x) for x in raw_ids.split(',') if x.strip()))
+    except ValueError:
+        return jsonify({'error': 'ids must be a comma-separated list of integers'}), 400
+    
+    if not ids:
+        return jsonify({'error': 'ids is required'}), 400
+    
+    max_ids = app.config['BATCH_MAX_IDS']
+    if len(ids) > max_ids:
+        return jsonify({'error': f'At most {max_ids} ids per request'}), 400
+    
+    weather_mode = request.args.get('weather', 'cached')
+    per_dest = app.config['BATCH_REVIEWS_PER_DESTINATION']
+    
+    destinations = Destination.query.filter(Destination.id.in_(ids)).all()
+    
+    # Latest N reviews per destination in one query (window function)
+    ranked = db.session.query(
+        Review.id.label('review_id'),
+        func.row_number().over(
+            partition_by=Review.destination_id,
+            order_by=(Review.created_at.desc(), Review.id.desc())
+        ).label('rank')
+    ).filter(Review.destination_id.in_(ids)).subquery()
+    
+    review_rows = db.session.query(Review, User.username).join(
+        ranked, Review.id == ranked.c.review_id
+    ).join(User, User.id == Review.user_id).filter(
+        ranked.c.rank <= per_dest
+    ).order_by(Review.destination_id, Review.created_at.desc(), Review.id.desc()).all()
+    
+    reviews_by_dest = {}
+    for r, username in review_rows:
+        reviews_by_dest.setdefault(r.destination_id, []).append({
+            'id': r.id,
+            'user': username,
+            'rating': r.rating,
+            'comment': r.comment,
+            'created_at': r.created_at.isoformat()
+        })
+    
+    weather_by_dest = {}
+    if weather_mode != 'none':
+        located = [d for d in destinations if d.latitude and d.longitude]
+        if weather_mode == 'cached':
+            weather_by_dest = {d.id: peek_cached_weather_data(d.latitude, d.longitude) for d in located}
+        elif located:
+            with ThreadPoolExecutor(max_workers=min(8, len(located))) as pool:
+                results = pool.map(lambda d: get_cached_weather_data(d.latitude, d.longitude), located)
+                weather_by_dest = {d.id: data for d, data in zip(located, results)}
+    
+    by_id = {d.id: d for d in destinations}
+    items = []
+    for dest_id in ids:
+        dest = by_id.get(dest_id)
+        if not dest:
+            continue
+        item = destination_to_dict(dest)
+        item['reviews'] = reviews_by_dest.get(dest_id, [])
+        if weather_mode != 'none':
+            data = weather_by_dest.get(dest_id)
+            item['weather'] = weather_summary(dest, data) if data else {'available': False}
+        items.append(item)
+    
+    return jsonify({
+        'destinations': items,
+        'missing': [i for i in ids if i not in by_id]
+    })
 
 
 @app.route('/api/destination/<int:dest_id>')
@@ -335,18 +1132,7 @@ def get_destination(dest_id):
     reviews = Review.query.filter_by(destination_id=dest_id).order_by(Review.created_at.desc()).limit(10).all()
     
     return jsonify({
-        'id': dest.id,
-        'name': dest.name,
-        'category': dest.category,
-        'state': dest.state,
-        'latitude': dest.latitude,
-        'longitude': dest.longitude,
-        'image_url': dest.image_url,
-        'rating': dest.rating,
-        'popularity': dest.popularity,
-        'best_time': dest.best_time,
-        'ideal_weather': dest.ideal_weather,
-        'description': dest.description,
+        **destination_to_dict(dest),
         'reviews': [{
             'id': r.id,
             'user': r.user.username,
@@ -365,7 +1151,7 @@ def get_weather(dest_id):
     if not dest.latitude or not dest.longitude:
         return jsonify({'error': 'Destination coordinates not available'}), 404
     
-    weather_data = get_weather_data(dest.latitude, dest.longitude)
+    weather_data = get_cached_weather_data(dest.latitude, dest.longitude)
     
     if not weather_data:
         return jsonify({
@@ -373,34 +1159,48 @@ def get_weather(dest_id):
             'message': 'Weather data not available'
         })
     
-    temp = weather_data['main']['temp']
-    humidity = weather_data['main']['humidity']
-    description = weather_data['weather'][0]['description']
-    icon = weather_data['weather'][0]['icon']
-    
-    # Determine suitability
-    suitable = True
-    if dest.ideal_weather:
-        ideal_temp_range = dest.ideal_weather.split('-')
-        if len(ideal_temp_range) == 2:
-            try:
-                min_temp = float(ideal_temp_range[0])
-                max_temp = float(ideal_temp_range[1])
-                suitable = min_temp <= temp <= max_temp
-            except:
-                pass
-    
     return jsonify({
-        'available': True,
-        'temperature': temp,
-        'humidity': humidity,
-        'description': description,
-        'icon': icon,
-        'suitable': suitable,
+        **weather_summary(dest, weather_data),
         'raw': weather_data
     })
 
 
+# Routes - Recommendations API
+@app.route('/api/recommendations')
+@login_required
+def get_recommendations():
+    """Personalized destinations for the current user (?limit=1..RECOMMENDATIONS_TOP_N)"""
+    top_n = app.config['RECOMMENDATIONS_TOP_N']
+    limit = min(max(request.args.get('limit', top_n, type=int), 1), top_n)
+    return jsonify(get_user_recommendations(session['user_id'])[:limit])
+
+
+@app.route('/api/preferences', methods=['GET', 'POST'])
+@login_required
+def user_preferences():
+    """Get or replace the current user's travel preferences"""
+    user = User.query.get_or_404(session['user_id'])
+    
+    if request.method == 'GET':
+        categories, states = recommendations.parse_preferences(user.preferences)
+        return jsonify({'categories': categories, 'states': states})
+    
+    data = request.get_json() or {}
+    categories = data.get('categories', [])
+    states = data.get('states', [])
+    if not all(isinstance(v, list) and all(isinstance(x, str) for x in v) for v in (categories, states)):
+        return jsonify({'success': False, 'message': 'categories and states must be lists of strings'}), 400
+    
+    try:
+        user.preferences = json.dumps({'categories': categories, 'states': states})
+        bump_activity_version(user.id)
+        db.session.commit()
+        return jsonify({'success': True, 'message': 'Preferences saved'})
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'Error saving preferences: {str(e)}'}), 500
+
+
 # Routes - Booking API
 @app.route('/api/bookings', methods=['POST'])
 @login_required
@@ -409,6 +1209,13 @@ def create_booking():
     data = request.get_json()
     user_id = session['user_id']
     
+    # Bookings may be made without a destination; a given one must exist
+    destination_id = None
+    if data.get('destination_id') is not None:
+        destination_id = existing_destination_id(data.get('destination_id'))
+        if destination_id is None:
+            return jsonify({'success': False, 'message': 'Unknown destination'}), 400
+    
     try:
         # Calculate amounts
         services = data.get('services', [])
@@ -436,6 +1243,7 @@ def create_booking():
         # Create booking
         booking = Booking(
             user_id=user_id,
+            destination_id=destination_id,
             services=json.dumps(services),
             options=json.dumps(options),
             traveler_name=data.get('traveler', {}).get('name', ''),
@@ -453,6 +1261,7 @@ def create_booking():
         )
         
         db.session.add(booking)
+        bump_activity_version(user_id)
         db.session.commit()
         
         return jsonify({
@@ -511,14 +1320,33 @@ def save_plan():
     user_id = session['user_id']
     
     try:
-        plan = TravelPlan(
-            user_id=user_id,
-            destination_ids=json.dumps(data.get('destinations', [])),
-            start_date=datetime.strptime(data.get('startDate'), '%Y-%m-%d').date() if data.get('startDate') else None,
-            end_date=datetime.strptime(data.get('endDate'), '%Y-%m-%d').date() if data.get('endDate') else None,
-            route_data=json.dumps(data.get('route', {}))
-        )
+        # Accept both the camelCase and snake_case payloads the pages send
+        start_date = data.get('startDate') or data.get('start_date')
+        end_date = data.get('endDate') or data.get('end_date')
+        record = {
+            'user_id': user_id,
+            'destination_ids': json.dumps(data.get('destinations') or data.get('destination_ids') or []),
+            'start_date': start_date or None,
+            'end_date': end_date or None,
+            'route_data': json.dumps(data.get('route', {})),
+            'created_at': datetime.utcnow().isoformat()
+        }
+        # Validate dates now so bad input fails the request, not the background flush
+        row = _travel_plan_row(record)
+        
+        if app.config['WRITE_BEHIND_PLANS']:
+            try:
+                write_id = get_plan_writer().submit(record)
+                return jsonify({
+                    'success': True,
+                    'plan_id': None,
+                    'write_id': write_id,
+                    'message': 'Travel plan saved successfully'
+                }), 202
+            except QueueFull:
+                pass  # backlog is full: fall back to a synchronous save
         
+        plan = TravelPlan(**row)
         db.session.add(plan)
         db.session.commit()
         
@@ -601,6 +1429,10 @@ def create_review():
     if not destination_id or not rating:
         return jsonify({'success': False, 'message': 'Destination ID and rating are required'}), 400
     
+    destination_id = existing_destination_id(destination_id)
+    if destination_id is None:
+        return jsonify({'success': False, 'message': 'Unknown destination'}), 400
+    
     if rating < 1 or rating > 5:
         return jsonify({'success': False, 'message': 'Rating must be between 1 and 5'}), 400
     
@@ -621,6 +1453,7 @@ def create_review():
             avg_rating = sum(r.rating for r in all_reviews) / len(all_reviews)
             dest.rating = round(avg_rating, 2)
         
+        bump_activity_version(user_id)
         db.session.commit()
         
         return jsonify({
@@ -642,6 +1475,7 @@ def init_db():
     """Initialize database with sample data if needed"""
     with app.app_context():
         db.create_all()
+        upgrade_schema()
         
         # Check if destinations already exist
         if Destination.query.count() == 0:
@@ -692,6 +1526,20 @@ if os.getenv('INIT_DB_ON_STARTUP', '1') == '1':
         # Don't crash deploy if DB is temporarily unavailable (e.g., first boot)
         print(f"DB init skipped/failed: {e}")
 
+# Start the plan writer now so journals left by a previous run are replayed
+# before requests arrive, not on the first save
+if app.config['WRITE_BEHIND_PLANS']:
+    try:
+        get_plan_writer()
+    except Exception as e:
+        print(f"Write-behind startup failed: {e}")
+
+# Optional in-process score refresh (safe with several workers, see update_scores)
+if app.config['SCORES_REFRESH_SECONDS'] > 0:
+    threading.Thread(
+        target=_score_refresh_loop, args=(app.config['SCORES_REFRESH_SECONDS'],), daemon=True
+    ).start()
+
 
 if __name__ == '__main__':
     port = int(os.getenv('PORT', '5000'))
@@ -0,0 +1,3 @@
+"""
+NAVIGo benchmark and load-test suite
+"""
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the NAVIGo benchmark suite
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+
+
+def load_app(database_url):
+    """Import the Flask app bound to the given database.
+
+    app.py reads its configuration at import time, so the environment has to
+    be prepared before the first import.
+    """
+    os.environ['DATABASE_URL'] = database_url
+    os.environ['INIT_DB_ON_STARTUP'] = '0'
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import app as navigo
+    return navigo
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms):
+    """Latency summary (milliseconds) for a list of samples"""
+    if not samples_ms:
+        return {'count': 0}
+    return {
+        'count': len(samples_ms),
+        'mean_ms': round(statistics.fmean(samples_ms), 3),
+        'min_ms': round(min(samples_ms), 3),
+        'p50_ms': round(percentile(samples_ms, 50), 3),
+        'p90_ms': round(percentile(samples_ms, 90), 3),
+        'p99_ms': round(percentile(samples_ms, 99), 3),
+        'max_ms': round(max(samples_ms), 3),
+    }
+
+
+def git_commit():
+    """Current git commit (short hash), or None outside a checkout"""
+    try:
+        out = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True
+        )
+        return out.stdout.strip()
+    except Exception:
+        return None
+
+
+def redact_url(database_url):
+    """Strip credentials from a database URL before it is written to disk"""
+    if '@' in database_url and '://' in database_url:
+        scheme, rest = database_url.split('://', 1)
+        return f"{scheme}://***@{rest.split('@', 1)[1]}"
+    return database_url
+
+
+def write_results(kind, payload, output=None):
+    """Write a benchmark run to benchmarks/results/ as JSON and return the path"""
+    commit = git_commit()
+    now = datetime.utcnow()
+    document = {
+        'kind': kind,
+        'commit': commit,
+        'timestamp': now.isoformat() + 'Z',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        **payload
+    }
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        name = f"{kind}-{now.strftime('%Y%m%dT%H%M%S')}-{commit or 'nogit'}.json"
+        output = os.path.join(RESULTS_DIR, name)
+    with open(output, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+    return output
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files
+
+Usage:
+    python -m benchmarks.compare benchmarks/results/micro-A.json benchmarks/results/micro-B.json
+"""
+
+import argparse
+import json
+
+METRICS = ['p50_ms', 'p99_ms', 'throughput_rps']
+
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline, candidate):
+    """Return rows of (scenario, metric, baseline, candidate, change %)"""
+    rows = []
+    base_scenarios = baseline.get('scenarios', {})
+    cand_scenarios = candidate.get('scenarios', {})
+    for name in sorted(set(base_scenarios) & set(cand_scenarios)):
+        for metric in METRICS:
+            before = base_scenarios[name].get(metric)
+            after = cand_scenarios[name].get(metric)
+            if before is None or after is None:
+                continue
+            change = ((after - before) / before * 100.0) if before else None
+            rows.append((name, metric, before, after, change))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two NAVIGo benchmark runs')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    args = parser.parse_args()
+
+    baseline = _load(args.baseline)
+    candidate = _load(args.candidate)
+    print(f"baseline:  {baseline.get('commit')} ({baseline.get('timestamp')})")
+    print(f"candidate: {candidate.get('commit')} ({candidate.get('timestamp')})")
+    if baseline.get('dataset') != candidate.get('dataset'):
+        print(f"WARNING: data sets differ: {baseline.get('dataset')} vs {candidate.get('dataset')}")
+    print()
+    for name, metric, before, after, change in compare(baseline, candidate):
+        change_str = f"{change:+7.1f}%" if change is not None else '    n/a'
+        print(f"{name:28s} {metric:15s} {before:12.3f} -> {after:12.3f} {change_str}")
+
+
+if __name__ == '__main__':
+    main()
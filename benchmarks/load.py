@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Concurrent load generator for a running NAVIGo server
+
+Start the app (e.g. `gunicorn -w 4 -b 127.0.0.1:8000 app:app` against a seeded
+database) and point this script at it. Each worker logs in as its own
+synthetic user and issues a weighted mix of requests for a fixed duration.
+
+Usage:
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --concurrency 32 --duration 30
+"""
+
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.common import summarize, write_results
+from benchmarks.seed import BENCH_PASSWORD
+
+# (name, weight, method, path template, needs a JSON body)
+DEFAULT_MIX = [
+    ('destinations_default', 30, 'GET', '/api/destinations', False),
+    ('destinations_category', 10, 'GET', '/api/destinations?category=Beach&sort=rating', False),
+    ('destination_detail', 30, 'GET', '/api/destination/{dest_id}', False),
+    ('reviews_list', 10, 'GET', '/api/reviews/{dest_id}', False),
+    ('my_bookings', 5, 'GET', '/api/bookings/my', False),
+    ('recommendations', 10, 'GET', '/api/recommendations', False),
+    ('create_booking', 10, 'POST', '/api/bookings', True),
+    ('save_plan', 5, 'POST', '/api/plan/save', True),
+]
+
+
+def _body(name, rng, max_dest_id):
+    if name == 'create_booking':
+        return {
+            'destination_id': rng.randint(1, max_dest_id),
+            'services': ['hotel'],
+            'options': {'hotel': {'name': 'Standard Room', 'price': 3200}},
+            'travelers': 2,
+            'startDate': '2026-12-01',
+            'endDate': '2026-12-05',
+            'traveler': {'name': 'Bench Traveler', 'email': 'traveler@example.com', 'phone': '9999999999'},
+        }
+    return {
+        'destinations': [rng.randint(1, max_dest_id) for _ in range(3)],
+        'startDate': '2026-12-01',
+        'endDate': '2026-12-05',
+        'route': {'type': 'LineString', 'coordinates': [[77.2, 28.6], [78.0, 27.1]]},
+    }
+
+
+def _worker(worker_id, base_url, deadline, mix, max_dest_id, read_only, results, lock):
+    rng = random.Random(worker_id)
+    http = requests.Session()
+    login = http.post(f"{base_url}/login", json={
+        'email': f"bench{worker_id}@example.com",
+        'password': BENCH_PASSWORD,
+    }, timeout=30)
+    logged_in = login.status_code == 200
+
+    entries = [m for m in mix if not (read_only and m[2] != 'GET')]
+    weights = [m[1] for m in entries]
+    local = {}
+    while time.monotonic() < deadline:
+        name, _weight, method, path, has_body = rng.choices(entries, weights=weights)[0]
+        if not logged_in and name in ('my_bookings', 'recommendations', 'create_booking', 'save_plan'):
+            continue
+        url = base_url + path.format(dest_id=rng.randint(1, max_dest_id))
+        body = _body(name, rng, max_dest_id) if has_body else None
+        started = time.perf_counter()
+        try:
+            resp = http.request(method, url, json=body, timeout=30, allow_redirects=False)
+            status = resp.status_code
+        except requests.RequestException:
+            status = 'error'
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        bucket = local.setdefault(name, {'samples': [], 'statuses': {}})
+        bucket['samples'].append(elapsed_ms)
+        bucket['statuses'][str(status)] = bucket['statuses'].get(str(status), 0) + 1
+
+    with lock:
+        for name, bucket in local.items():
+            merged = results.setdefault(name, {'samples': [], 'statuses': {}})
+            merged['samples'].extend(bucket['samples'])
+            for status, count in bucket['statuses'].items():
+                merged['statuses'][status] = merged['statuses'].get(status, 0) + count
+
+
+def run(base_url, concurrency=16, duration=30, max_dest_id=10000, read_only=False):
+    base_url = base_url.rstrip('/')
+    results = {}
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + duration
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for worker_id in range(concurrency):
+            pool.submit(_worker, worker_id, base_url, deadline, DEFAULT_MIX, max_dest_id, read_only, results, lock)
+
+    elapsed = time.monotonic() - started
+    scenarios = {}
+    all_samples = []
+    for name, bucket in sorted(results.items()):
+        summary = summarize(bucket['samples'])
+        summary['statuses'] = bucket['statuses']
+        summary['throughput_rps'] = round(len(bucket['samples']) / elapsed, 2)
+        scenarios[name] = summary
+        all_samples.extend(bucket['samples'])
+
+    overall = summarize(all_samples)
+    overall['throughput_rps'] = round(len(all_samples) / elapsed, 2)
+    return {
+        'base_url': base_url,
+        'concurrency': concurrency,
+        'duration_s': round(elapsed, 3),
+        'read_only': read_only,
+        'overall': overall,
+        'scenarios': scenarios,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NAVIGo concurrent load generator')
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=30.0, help='Seconds to run')
+    parser.add_argument('--max-dest-id', type=int, default=10000, help='Highest destination id to request')
+    parser.add_argument('--read-only', action='store_true', help='Only issue GET requests')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/load-<time>-<commit>.json)')
+    args = parser.parse_args()
+
+    payload = run(args.base_url, args.concurrency, args.duration, args.max_dest_id, args.read_only)
+    overall = payload['overall']
+    print(f"{overall['count']} requests, {overall['throughput_rps']} req/s, "
+          f"p50={overall.get('p50_ms')}ms p99={overall.get('p99_ms')}ms")
+    path = write_results('load', payload, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == '__main__':
+    main()
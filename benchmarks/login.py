@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Login throughput benchmark
+
+Logs the seeded bench users in concurrently through the Flask test client and
+reports logins/second plus latency percentiles. Password hashing dominates
+this path, so run it once per PASSWORD_HASH_METHOD you want to compare; the
+warmup round lets rehash-on-login upgrade the seeded hashes first.
+
+Usage:
+    python -m benchmarks.login --database-url sqlite:////tmp/navigo-bench.db --hash-method scrypt:16384:8:1
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import load_app, summarize, write_results, redact_url
+from benchmarks.seed import BENCH_PASSWORD
+
+
+def _login_many(navigo, user_numbers):
+    client = navigo.app.test_client()
+    samples = []
+    failures = 0
+    for n in user_numbers:
+        started = time.perf_counter()
+        resp = client.post('/login', json={'email': f"bench{n}@example.com", 'password': BENCH_PASSWORD})
+        samples.append((time.perf_counter() - started) * 1000.0)
+        if resp.status_code != 200:
+            failures += 1
+        client.get('/logout')
+    return samples, failures
+
+
+def run(database_url, users=50, rounds=4, concurrency=8, hash_method=None, session_store=None):
+    if hash_method:
+        os.environ['PASSWORD_HASH_METHOD'] = hash_method
+    if session_store:
+        os.environ['SESSION_STORE'] = session_store
+    navigo = load_app(database_url)
+    navigo.app.config['TESTING'] = True
+
+    # Warmup: one login per user (also rehashes to the configured method)
+    _login_many(navigo, range(users))
+
+    work = [n for _ in range(rounds) for n in range(users)]
+    slices = [work[i::concurrency] for i in range(concurrency)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda s: _login_many(navigo, s), slices))
+    elapsed = time.perf_counter() - started
+
+    samples = [ms for batch, _ in outcomes for ms in batch]
+    failures = sum(f for _, f in outcomes)
+    summary = summarize(samples)
+    summary['failures'] = failures
+    summary['throughput_rps'] = round(len(samples) / elapsed, 2)
+
+    return {
+        'database_url': redact_url(database_url),
+        'hash_method': navigo.app.config['PASSWORD_HASH_METHOD'],
+        'session_store': navigo.app.config['SESSION_STORE'],
+        'concurrency': concurrency,
+        'duration_s': round(elapsed, 3),
+        'scenarios': {'login': summary},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NAVIGo login throughput benchmark')
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--users', type=int, default=50, help='Number of seeded bench users to log in')
+    parser.add_argument('--rounds', type=int, default=4, help='Logins per user')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--hash-method', help='Override PASSWORD_HASH_METHOD')
+    parser.add_argument('--session-store', choices=['cookie', 'memory'], help='Override SESSION_STORE')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/login-<time>-<commit>.json)')
+    args = parser.parse_args()
+
+    payload = run(args.database_url, args.users, args.rounds, args.concurrency,
+                  args.hash_method, args.session_store)
+    login = payload['scenarios']['login']
+    print(f"{payload['hash_method']}: {login['throughput_rps']} logins/s, "
+          f"p50={login['p50_ms']}ms p99={login['p99_ms']}ms failures={login['failures']}")
+    path = write_results('login', payload, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == '__main__':
+    main()
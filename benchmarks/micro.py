@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the NAVIGo API using the Flask test client
+
+Runs each scenario in-process (no network, no WSGI server) so the numbers
+reflect view, query and serialization cost only.
+
+Only read scenarios run by default, so repeated runs see the same data set.
+--writes adds booking and plan saves; the rows they insert are deleted again
+after the run.
+
+Usage:
+    python -m benchmarks.micro --database-url sqlite:////tmp/navigo-bench.db --iterations 200
+"""
+
+import argparse
+import json
+import random
+import time
+
+from benchmarks.common import load_app, summarize, write_results, redact_url
+
+
+def _booking_payload(dest_id):
+    return {
+        'destination_id': dest_id,
+        'services': ['hotel'],
+        'options': {'hotel': {'name': 'Standard Room', 'price': 3200}},
+        'travelers': 2,
+        'startDate': '2026-12-01',
+        'endDate': '2026-12-05',
+        'traveler': {'name': 'Bench Traveler', 'email': 'traveler@example.com', 'phone': '9999999999'},
+        'paymentMethod': 'card'
+    }
+
+
+def _plan_payload(dest_ids):
+    return {
+        'destinations': dest_ids,
+        'startDate': '2026-12-01',
+        'endDate': '2026-12-05',
+        'route': {'type': 'LineString', 'coordinates': [[77.2, 28.6], [78.0, 27.1]]}
+    }
+
+
+def dataset_counts(navigo):
+    """Row counts of the tables the scenarios read, recorded with each run"""
+    models = {
+        'destinations': navigo.Destination,
+        'users': navigo.User,
+        'bookings': navigo.Booking,
+        'reviews': navigo.Review,
+        'travel_plans': navigo.TravelPlan,
+    }
+    return {name: model.query.count() for name, model in models.items()}
+
+
+def _max_ids(navigo, models):
+    return {model: navigo.db.session.query(navigo.db.func.max(model.id)).scalar() or 0 for model in models}
+
+
+def build_scenarios(dest_ids, include_writes=False):
+    """Return (name, method, url_factory, json_factory, needs_login) tuples"""
+    pick = random.Random(7)
+    scenarios = [
+        ('destinations_default', 'GET', lambda: '/api/destinations', None, False),
+        ('destinations_by_rating', 'GET', lambda: '/api/destinations?sort=rating', None, False),
+        ('destinations_category', 'GET', lambda: '/api/destinations?category=Heritage', None, False),
+        ('destinations_search', 'GET', lambda: '/api/destinations?search=Fort', None, False),
+        ('destination_detail', 'GET', lambda: f"/api/destination/{pick.choice(dest_ids)}", None, False),
+        ('reviews_list', 'GET', lambda: f"/api/reviews/{pick.choice(dest_ids)}", None, False),
+        ('weather', 'GET', lambda: f"/api/weather/{pick.choice(dest_ids)}", None, False),
+        ('my_bookings', 'GET', lambda: '/api/bookings/my', None, True),
+        ('recommendations', 'GET', lambda: '/api/recommendations', None, True),
+    ]
+    if include_writes:
+        scenarios += [
+            ('create_booking', 'POST', lambda: '/api/bookings',
+             lambda: _booking_payload(pick.choice(dest_ids)), True),
+            ('save_plan', 'POST', lambda: '/api/plan/save',
+             lambda: _plan_payload(pick.sample(dest_ids, min(3, len(dest_ids)))), True),
+        ]
+    return scenarios
+
+
+def run(database_url, iterations=100, warmup=5, only=None, include_writes=False, user_id=1):
+    navigo = load_app(database_url)
+    navigo.app.config['TESTING'] = True
+    written_models = (navigo.Booking, navigo.TravelPlan)
+
+    with navigo.app.app_context():
+        dest_ids = [row[0] for row in navigo.db.session.query(navigo.Destination.id).limit(10000).all()]
+        dataset = dataset_counts(navigo)
+        max_ids = _max_ids(navigo, written_models)
+    if not dest_ids:
+        raise SystemExit('No destinations found - run benchmarks.seed first')
+
+    client = navigo.app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+        sess['username'] = f"bench{user_id}"
+
+    try:
+        results = _run_scenarios(client, build_scenarios(dest_ids, include_writes), iterations, warmup, only)
+    finally:
+        if include_writes:
+            # Remove what the write scenarios inserted so the next run sees the same data
+            with navigo.app.app_context():
+                for model, max_id in max_ids.items():
+                    model.query.filter(model.id > max_id).delete(synchronize_session=False)
+                navigo.db.session.commit()
+
+    return {
+        'database_url': redact_url(database_url),
+        'dataset': dataset,
+        'include_writes': include_writes,
+        'iterations': iterations,
+        'warmup': warmup,
+        'scenarios': results,
+    }
+
+
+def _run_scenarios(client, scenarios, iterations, warmup, only):
+    results = {}
+    for name, method, url_for, json_for, _needs_login in scenarios:
+        if only and name not in only:
+            continue
+        samples = []
+        statuses = {}
+        for i in range(warmup + iterations):
+            url = url_for()
+            body = json_for() if json_for else None
+            started = time.perf_counter()
+            resp = client.open(url, method=method, json=body)
+            resp.get_data()
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            if i >= warmup:
+                samples.append(elapsed_ms)
+                statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+        summary = summarize(samples)
+        summary['statuses'] = {str(k): v for k, v in statuses.items()}
+        results[name] = summary
+        print(f"{name:28s} p50={summary['p50_ms']:9.3f}ms p99={summary['p99_ms']:9.3f}ms")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NAVIGo Flask test-client micro-benchmarks')
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--only', nargs='*', help='Run only the named scenarios')
+    parser.add_argument('--writes', action='store_true',
+                        help='Also time booking and plan saves (inserted rows are deleted afterwards)')
+    parser.add_argument('--user-id', type=int, default=1, help='User id placed in the session for login-only routes')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/micro-<time>-<commit>.json)')
+    args = parser.parse_args()
+
+    payload = run(
+        args.database_url,
+        iterations=args.iterations,
+        warmup=args.warmup,
+        only=set(args.only) if args.only else None,
+        include_writes=args.writes,
+        user_id=args.user_id,
+    )
+    path = write_results('micro', payload, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Travel plan write throughput: synchronous commits vs the write-behind queue
+
+Concurrent clients save plans through the Flask test client. For the
+write-behind mode the clock only stops once the queue has flushed, so the
+throughput figure counts persisted rows, not just acknowledged requests.
+
+Usage:
+    python -m benchmarks.writes --database-url sqlite:////tmp/navigo-bench.db --concurrency 16 --saves 50
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import load_app, summarize, write_results, redact_url
+
+PLAN = {
+    'destinations': [1, 2, 3],
+    'startDate': '2026-12-01',
+    'endDate': '2026-12-05',
+    'route': {'type': 'LineString', 'coordinates': [[77.2, 28.6], [78.0, 27.1]]},
+}
+
+
+def _client_saves(navigo, user_id, saves):
+    client = navigo.app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = user_id
+    samples = []
+    statuses = {}
+    for _ in range(saves):
+        started = time.perf_counter()
+        resp = client.post('/api/plan/save', json=PLAN)
+        samples.append((time.perf_counter() - started) * 1000.0)
+        statuses[str(resp.status_code)] = statuses.get(str(resp.status_code), 0) + 1
+    return samples, statuses
+
+
+def run_mode(navigo, write_behind, concurrency, saves):
+    navigo.app.config['WRITE_BEHIND_PLANS'] = write_behind
+    with navigo.app.app_context():
+        before = navigo.TravelPlan.query.count()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(lambda uid: _client_saves(navigo, uid, saves), range(1, concurrency + 1)))
+    acked = time.perf_counter() - started
+    flushed = True
+    if write_behind:
+        flushed = navigo.get_plan_writer().flush()
+    persisted = time.perf_counter() - started
+
+    with navigo.app.app_context():
+        written = navigo.TravelPlan.query.count() - before
+
+    samples = [ms for batch, _ in outcomes for ms in batch]
+    statuses = {}
+    for _, batch_statuses in outcomes:
+        for status, count in batch_statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+    summary = summarize(samples)
+    summary.update({
+        'statuses': statuses,
+        'rows_written': written,
+        'all_persisted': flushed and written == len(samples),
+        'ack_seconds': round(acked, 3),
+        'persist_seconds': round(persisted, 3),
+        'throughput_rps': round(written / persisted, 2) if persisted else None,
+    })
+    return summary
+
+
+def run(database_url, concurrency=16, saves=50):
+    navigo = load_app(database_url)
+    navigo.app.config['TESTING'] = True
+    journal_dir = tempfile.mkdtemp(prefix='navigo-wb-')
+    navigo.app.config['WRITE_BEHIND_JOURNAL_DIR'] = journal_dir
+    try:
+        scenarios = {
+            'save_plan_sync': run_mode(navigo, False, concurrency, saves),
+            'save_plan_write_behind': run_mode(navigo, True, concurrency, saves),
+        }
+        navigo.get_plan_writer().close()
+    finally:
+        shutil.rmtree(journal_dir, ignore_errors=True)
+    return {
+        'database_url': redact_url(database_url),
+        'concurrency': concurrency,
+        'saves_per_client': saves,
+        'scenarios': scenarios,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NAVIGo travel plan write benchmark')
+    parser.add_argument('--database-url', required=True)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--saves', type=int, default=50, help='Saves per client')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/writes-<time>-<commit>.json)')
+    args = parser.parse_args()
+
+    payload = run(args.database_url, args.concurrency, args.saves)
+    for name, summary in payload['scenarios'].items():
+        print(f"{name:24s} {summary['throughput_rps']:9.1f} rows/s  "
+              f"p50={summary['p50_ms']}ms p99={summary['p99_ms']}ms rows={summary['rows_written']}")
+        if not summary['all_persisted']:
+            print(f"{'':24s} WARNING: not every save was persisted; see the write-behind log")
+    path = write_results('writes', payload, args.output)
+    print(f"Results written to {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+NAVIGo static asset build
+
+Minifies static/css/*.css and static/js/*.js, writes content-hashed copies to
+static/dist/ together with gzip and brotli variants, and records the mapping
+in static/dist/manifest.json. The app's asset_url() helper reads that manifest;
+without a build it falls back to the unminified sources.
+
+Usage:
+    python build_assets.py
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+try:
+    import brotli
+except ImportError:  # brotli variants are optional
+    brotli = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(ROOT_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+SOURCE_DIRS = [('css', '.css'), ('js', '.js')]
+
+
+def minify_css(source):
+    """Strip comments and collapse whitespace"""
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r'\s*([{};,>])\s*', r'\1', source)
+    source = re.sub(r':\s+', ':', source)
+    source = source.replace(';}', '}')
+    return source.strip() + '\n'
+
+
+def minify_js(source):
+    """Conservative JS minification.
+
+    Drops indentation, blank lines and whole-line // comments but keeps line
+    breaks, so automatic semicolon insertion behaves exactly as before. Lines
+    inside multi-line template literals are left untouched.
+    """
+    out = []
+    in_template = False
+    for line in source.splitlines():
+        if in_template:
+            out.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('//'):
+                out.append(stripped)
+        # Track whether this line leaves a template literal open
+        ticks = len(re.findall(r'(?<!\\)`', line))
+        if ticks % 2:
+            in_template = not in_template
+    return '\n'.join(out) + '\n'
+
+
+MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR):
+    """Build all assets and return the manifest {source: hashed dist path}"""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+
+    manifest = {}
+    for subdir, ext in SOURCE_DIRS:
+        src_dir = os.path.join(static_dir, subdir)
+        if not os.path.isdir(src_dir):
+            continue
+        for name in sorted(os.listdir(src_dir)):
+            if not name.endswith(ext):
+                continue
+            with open(os.path.join(src_dir, name), 'r', encoding='utf-8') as f:
+                minified = MINIFIERS[ext](f.read()).encode('utf-8')
+
+            digest = hashlib.sha256(minified).hexdigest()[:12]
+            hashed_name = f"{subdir}/{name[:-len(ext)]}.{digest}{ext}"
+            out_path = os.path.join(dist_dir, hashed_name)
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+            with open(out_path, 'wb') as f:
+                f.write(minified)
+            # mtime=0 keeps .gz output byte-identical across builds
+            with open(out_path + '.gz', 'wb') as f:
+                f.write(gzip.compress(minified, compresslevel=9, mtime=0))
+            if brotli is not None:
+                with open(out_path + '.br', 'wb') as f:
+                    f.write(brotli.compress(minified, quality=11))
+
+            manifest[f"{subdir}/{name}"] = hashed_name
+
+    os.makedirs(dist_dir, exist_ok=True)
+    with open(os.path.join(dist_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def main():
+    manifest = build()
+    for source, hashed in sorted(manifest.items()):
+        original = os.path.getsize(os.path.join(STATIC_DIR, source))
+        built = os.path.join(DIST_DIR, hashed)
+        sizes = f"{original} -> {os.path.getsize(built)} min, {os.path.getsize(built + '.gz')} gz"
+        if os.path.exists(built + '.br'):
+            sizes += f", {os.path.getsize(built + '.br')} br"
+        print(f"{source:24s} {sizes}")
+    if brotli is None:
+        print("brotli not installed - skipped .br variants", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+NAVIGo - Personalized recommendations
+
+Destinations are encoded compactly as a category index, a state index and two
+normalized numeric signals (rating, popularity), held as NumPy arrays. A user
+profile is an affinity weight per category and per state built from stored
+preferences, bookings and reviews. Scoring every destination is then a pair
+of array gathers plus a weighted sum, with no per-row Python.
+"""
+
+import json
+import threading
+import time
+
+import numpy as np
+
+# Profile weights. Activity (bookings, reviews) is normalized to [-1, 1];
+# each stated preference adds PREFERENCE_WEIGHT on top.
+PREFERENCE_WEIGHT = 1.0
+BOOKING_WEIGHT = 1.0
+REVIEW_WEIGHT = 1.0  # scaled by (rating - 3) / 2, so poor reviews count against
+
+# Score weights for the non-personal signals
+RATING_WEIGHT = 0.3
+POPULARITY_WEIGHT = 0.5
+
+
+class Catalogue:
+    """Column arrays for every destination, sorted by id"""
+
+    def __init__(self, rows):
+        # rows: iterable of (id, category, state, rating, popularity_score, popularity)
+        rows = sorted(rows, key=lambda r: r[0])
+        self.categories = sorted({r[1] or '' for r in rows})
+        self.states = sorted({r[2] or '' for r in rows})
+        cat_lookup = {c: i for i, c in enumerate(self.categories)}
+        state_lookup = {s: i for i, s in enumerate(self.states)}
+
+        self.ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+        self.category_idx = np.fromiter((cat_lookup[r[1] or ''] for r in rows), dtype=np.int32, count=len(rows))
+        self.state_idx = np.fromiter((state_lookup[r[2] or ''] for r in rows), dtype=np.int32, count=len(rows))
+
+        rating = np.fromiter((r[3] or 0.0 for r in rows), dtype=np.float32, count=len(rows))
+        self.rating = rating / 5.0
+
+        # Activity score where there is one, curated seed popularity otherwise
+        score = np.fromiter((r[4] or 0.0 for r in rows), dtype=np.float32, count=len(rows))
+        seed = np.fromiter((r[5] or 0 for r in rows), dtype=np.float32, count=len(rows))
+        self.popularity = _normalize(score) if score.any() else _normalize(seed)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def positions(self, dest_ids):
+        """Array positions of the given destination ids (unknown ids dropped)"""
+        if not len(self.ids):
+            return np.empty(0, dtype=np.int64)
+        wanted = np.asarray(list(dest_ids), dtype=np.int64)
+        pos = np.searchsorted(self.ids, wanted)
+        pos = np.clip(pos, 0, len(self.ids) - 1)
+        return pos[self.ids[pos] == wanted]
+
+
+def _normalize(values):
+    top = values.max() if len(values) else 0.0
+    return values / top if top > 0 else values
+
+
+def parse_preferences(raw):
+    """User.preferences JSON -> (categories, states).
+
+    Accepts {"categories": [...], "states": [...]} or a plain list of
+    category/state names.
+    """
+    if not raw:
+        return [], []
+    try:
+        prefs = json.loads(raw)
+    except (TypeError, ValueError):
+        return [], []
+    if isinstance(prefs, list):
+        return _strings(prefs), _strings(prefs)
+    if isinstance(prefs, dict):
+        return _strings(prefs.get('categories')), _strings(prefs.get('states'))
+    return [], []
+
+
+def _strings(values):
+    """String entries of a JSON list; anything else is ignored"""
+    if not isinstance(values, list):
+        return []
+    return [v for v in values if isinstance(v, str)]
+
+
+def build_profile(catalogue, preferences, booked_ids, reviews):
+    """Category and state affinity vectors for one user.
+
+    reviews: iterable of (destination_id, rating).
+    """
+    n_cat, n_state = len(catalogue.categories), len(catalogue.states)
+
+    # Activity: bookings and reviews, scaled to [-1, 1] so heavy users don't
+    # drown out their stated preferences or the base signals
+    activity_cat = np.zeros(n_cat, dtype=np.float32)
+    activity_state = np.zeros(n_state, dtype=np.float32)
+
+    booked_pos = catalogue.positions(booked_ids)
+    np.add.at(activity_cat, catalogue.category_idx[booked_pos], BOOKING_WEIGHT)
+    np.add.at(activity_state, catalogue.state_idx[booked_pos], BOOKING_WEIGHT)
+
+    reviews = list(reviews)
+    if reviews:
+        review_pos = catalogue.positions(r[0] for r in reviews)
+        by_id = {dest_id: rating for dest_id, rating in reviews}
+        weights = np.asarray(
+            [REVIEW_WEIGHT * ((by_id[i] or 3) - 3) / 2.0 for i in catalogue.ids[review_pos]],
+            dtype=np.float32
+        )
+        np.add.at(activity_cat, catalogue.category_idx[review_pos], weights)
+        np.add.at(activity_state, catalogue.state_idx[review_pos], weights)
+
+    for aff in (activity_cat, activity_state):
+        top = np.abs(aff).max() if len(aff) else 0.0
+        if top > 0:
+            aff /= top
+
+    # Stated preferences add a fixed boost on top
+    cat_aff, state_aff = activity_cat, activity_state
+    categories, states = parse_preferences(preferences)
+    cat_lookup = {c: i for i, c in enumerate(catalogue.categories)}
+    state_lookup = {s: i for i, s in enumerate(catalogue.states)}
+    for c in set(categories):
+        if c in cat_lookup:
+            cat_aff[cat_lookup[c]] += PREFERENCE_WEIGHT
+    for s in set(states):
+        if s in state_lookup:
+            state_aff[state_lookup[s]] += PREFERENCE_WEIGHT
+    return cat_aff, state_aff
+
+
+def recommend(catalogue, profile, n, exclude_ids=()):
+    """Top-n (destination_id, score) pairs, best first"""
+    if not len(catalogue):
+        return []
+    cat_aff, state_aff = profile
+    scores = (
+        cat_aff[catalogue.category_idx]
+        + state_aff[catalogue.state_idx]
+        + RATING_WEIGHT * catalogue.rating
+        + POPULARITY_WEIGHT * catalogue.popularity
+    )
+    excluded = np.unique(catalogue.positions(exclude_ids))
+    if len(excluded):
+        scores[excluded] = -np.inf
+
+    n = min(n, len(scores) - len(excluded))
+    if n <= 0:
+        return []
+    top = np.argpartition(-scores, n - 1)[:n]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return [(int(catalogue.ids[i]), float(scores[i])) for i in top]
+
+
+class TTLCache:
+    """Small thread-safe key/value cache with per-entry expiry"""
+
+    def __init__(self, ttl_seconds, max_entries=10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.max_entries:
+                self._data.pop(min(self._data, key=lambda k: self._data[k][0]))
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+NAVIGo - Data retention, archival and compaction
+
+Old rows are streamed to gzip-compressed JSONL archive files and then removed
+(or, for compaction policies, rewritten in place) in small id-ordered chunks.
+Each chunk is its own short transaction, so the tables are never locked for
+long. The archive chunk is flushed to disk before the matching rows are
+changed, so every removed row can be restored from the archive.
+
+After the policies run, the database is vacuumed and analyzed. On SQLite
+VACUUM rewrites the file, so the size difference is space returned to the
+OS. On Postgres a plain VACUUM only marks dead rows' space reusable without
+shrinking the relations, so the report gives the dead row versions VACUUM
+removed instead.
+"""
+
+import gzip
+import json
+import os
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import text
+
+
+class RetentionPolicy:
+    """What to do with rows of `model` older than `max_age_days`.
+
+    action: 'delete' archives then deletes rows; 'compact' archives the full
+    row then applies compact_fn(row) -> {column: new value} to it.
+    A policy with max_age_days <= 0 is disabled.
+    """
+
+    def __init__(self, name, model, timestamp_column, max_age_days, action='delete',
+                 compact_fn=None, extra_filter=None):
+        if action not in ('delete', 'compact'):
+            raise ValueError(f"Unknown retention action: {action}")
+        if action == 'compact' and compact_fn is None:
+            raise ValueError('compact policies need a compact_fn')
+        self.name = name
+        self.model = model
+        self.timestamp_column = timestamp_column
+        self.max_age_days = max_age_days
+        self.action = action
+        self.compact_fn = compact_fn
+        self.extra_filter = extra_filter
+
+    @property
+    def enabled(self):
+        return self.max_age_days > 0
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _row_dict(obj):
+    return {c.name: _json_value(getattr(obj, c.key)) for c in obj.__table__.columns}
+
+
+def _candidates(db, policy, cutoff, after_id, chunk_size):
+    model = policy.model
+    query = db.session.query(model).filter(policy.timestamp_column < cutoff, model.id > after_id)
+    if policy.extra_filter is not None:
+        query = query.filter(policy.extra_filter)
+    return query.order_by(model.id).limit(chunk_size).all()
+
+
+def apply_policy(db, policy, archive_dir, chunk_size=1000, dry_run=False, now=None):
+    """Archive and delete/compact rows matching one policy; returns stats"""
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(days=policy.max_age_days)
+    model = policy.model
+    stats = {'policy': policy.name, 'action': policy.action, 'cutoff': cutoff.isoformat(), 'rows': 0, 'archive': None}
+
+    archive = None
+    after_id = 0
+    try:
+        while True:
+            rows = _candidates(db, policy, cutoff, after_id, chunk_size)
+            if not rows:
+                break
+            after_id = rows[-1].id
+            stats['rows'] += len(rows)
+            if dry_run:
+                db.session.rollback()
+                continue
+
+            if archive is None:
+                os.makedirs(archive_dir, exist_ok=True)
+                path = os.path.join(archive_dir, f"{policy.name}-{now.strftime('%Y%m%dT%H%M%S')}.jsonl.gz")
+                archive = gzip.open(path, 'ab')
+                stats['archive'] = path
+
+            for row in rows:
+                archive.write((json.dumps(_row_dict(row), separators=(',', ':')) + '\n').encode('utf-8'))
+            # Make the archived chunk durable before touching the rows
+            archive.flush()
+            os.fsync(archive.fileobj.fileno())
+
+            ids = [row.id for row in rows]
+            if policy.action == 'delete':
+                db.session.expunge_all()
+                db.session.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+            else:
+                for row in rows:
+                    for column, value in policy.compact_fn(row).items():
+                        setattr(row, column, value)
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    finally:
+        if archive is not None:
+            archive.close()
+    return stats
+
+
+def database_size(db):
+    """Bytes used by the database (SQLite file) or by its tables (Postgres)"""
+    dialect = db.engine.dialect.name
+    with db.engine.connect() as conn:
+        if dialect == 'sqlite':
+            page_count = conn.execute(text('PRAGMA page_count')).scalar()
+            page_size = conn.execute(text('PRAGMA page_size')).scalar()
+            return page_count * page_size
+        if dialect == 'postgresql':
+            return conn.execute(text(
+                "SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0) FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relkind = 'r' AND n.nspname = current_schema()"
+            )).scalar()
+    return None
+
+
+def dead_tuples(db, tables):
+    """Dead row versions in the given tables (Postgres statistics), or None elsewhere"""
+    if db.engine.dialect.name != 'postgresql':
+        return None
+    if not tables:
+        return 0
+    with db.engine.connect() as conn:
+        return conn.execute(
+            text('SELECT COALESCE(SUM(n_dead_tup), 0) FROM pg_stat_user_tables '
+                 'WHERE schemaname = current_schema() AND relname = ANY(:tables)'),
+            {'tables': list(tables)}
+        ).scalar()
+
+
+def vacuum_analyze(db, tables):
+    """Reclaim space and refresh planner statistics.
+
+    VACUUM can't run inside a transaction, so this uses an autocommit
+    connection. On SQLite VACUUM rewrites the whole file; on Postgres only
+    the touched tables are vacuumed.
+    """
+    dialect = db.engine.dialect.name
+    db.session.remove()
+    with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        if dialect == 'sqlite':
+            conn.execute(text('VACUUM'))
+            conn.execute(text('ANALYZE'))
+        elif dialect == 'postgresql':
+            for table in tables:
+                conn.execute(text(f'VACUUM (ANALYZE) {table}'))
+        else:
+            for table in tables:
+                conn.execute(text(f'ANALYZE {table}'))
+
+
+def run_retention(db, policies, archive_dir, chunk_size=1000, dry_run=False, vacuum=True):
+    """Apply every enabled policy, then vacuum/analyze; returns a report"""
+    size_before = database_size(db)
+    results = []
+    touched = set()
+    for policy in policies:
+        if not policy.enabled:
+            continue
+        stats = apply_policy(db, policy, archive_dir, chunk_size=chunk_size, dry_run=dry_run)
+        results.append(stats)
+        if stats['rows']:
+            touched.add(policy.model.__tablename__)
+
+    dead_removed = None
+    if vacuum and not dry_run:
+        dead_before = dead_tuples(db, sorted(touched))
+        vacuum_analyze(db, sorted(touched))
+        dead_after = dead_tuples(db, sorted(touched))
+        if dead_before is not None and dead_after is not None:
+            dead_removed = max(0, dead_before - dead_after)
+    size_after = database_size(db)
+
+    # Only SQLite's VACUUM gives space back to the OS; Postgres relation sizes
+    # stay put after a plain VACUUM, so their difference isn't "reclaimed"
+    reclaimed = None
+    if db.engine.dialect.name == 'sqlite' and size_before is not None and size_after is not None:
+        reclaimed = size_before - size_after
+    return {
+        'dry_run': dry_run,
+        'policies': results,
+        'size_before_bytes': size_before,
+        'size_after_bytes': size_after,
+        'reclaimed_bytes': reclaimed,
+        'dead_tuples_removed': dead_removed,
+    }
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+NAVIGo - Server-side session store
+
+Flask's default session lives entirely in the signed cookie, so a session can't
+be revoked before the cookie expires. This module keeps session data in a
+process-local store with TTL eviction; the cookie only carries a signed
+session id. Lookups never touch the database.
+
+Note: the memory store is per process. Under gunicorn with several workers,
+run with a single worker (plus threads) or sticky sessions.
+"""
+
+import secrets
+import threading
+import time
+
+from flask.sessions import SessionInterface, SessionMixin
+from itsdangerous import BadSignature, Signer, want_bytes
+from werkzeug.datastructures import CallbackDict
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """Session dict that remembers its id and whether it changed"""
+
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.previous_sid = None
+
+    def regenerate(self):
+        """Move the session to a fresh id (call on login to prevent fixation).
+
+        The old id is dropped from the store when the response is saved.
+        """
+        if self.previous_sid is None and not self.new:
+            self.previous_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.new = True
+        self.modified = True
+
+
+class MemorySessionStore:
+    """Thread-safe in-memory session store with sliding TTL eviction"""
+
+    def __init__(self, ttl_seconds=7 * 24 * 3600, max_entries=100000, sweep_interval=60):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._data = {}  # sid -> (expires_at, dict)
+        self._lock = threading.Lock()
+        self._next_sweep = time.monotonic() + sweep_interval
+
+    def get(self, sid):
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_sweep(now)
+            entry = self._data.get(sid)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= now:
+                del self._data[sid]
+                return None
+            # Sliding expiry: active sessions stay alive
+            self._data[sid] = (now + self.ttl_seconds, data)
+            return dict(data)
+
+    def set(self, sid, data):
+        now = time.monotonic()
+        with self._lock:
+            self._maybe_sweep(now)
+            if sid not in self._data and len(self._data) >= self.max_entries:
+                self._evict_oldest()
+            self._data[sid] = (now + self.ttl_seconds, dict(data))
+
+    def delete(self, sid):
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def _maybe_sweep(self, now):
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.sweep_interval
+        expired = [sid for sid, (expires_at, _) in self._data.items() if expires_at <= now]
+        for sid in expired:
+            del self._data[sid]
+
+    def _evict_oldest(self):
+        # Entries expiring soonest are the least recently used
+        oldest = min(self._data, key=lambda sid: self._data[sid][0])
+        del self._data[oldest]
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface backed by a session store"""
+
+    salt = 'navigo-session'
+
+    def __init__(self, store):
+        self.store = store
+
+    def _signer(self, app):
+        return Signer(app.secret_key, salt=self.salt, key_derivation='hmac')
+
+    def open_session(self, app, request):
+        if not app.secret_key:
+            return None
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = self._signer(app).unsign(want_bytes(cookie)).decode('utf-8')
+            except BadSignature:
+                sid = None
+            if sid:
+                data = self.store.get(sid)
+                if data is not None:
+                    return ServerSideSession(data, sid=sid)
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.previous_sid:
+            self.store.delete(session.previous_sid)
+
+        if not session:
+            if session.modified:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        if not session.modified and not self.should_set_cookie(app, session):
+            return
+
+        self.store.set(session.sid, dict(session))
+        response.set_cookie(
+            name,
+            self._signer(app).sign(want_bytes(session.sid)).decode('utf-8'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
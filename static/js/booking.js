@@ -0,0 +1,231 @@
+let currentStep = 1;
+let selectedServices = new Set();
+let selectedOptions = {};
+let totalAmount = 0;
+
+// Check if coming from plan page
+window.addEventListener('DOMContentLoaded', () => {
+    const planData = sessionStorage.getItem('tripPlan');
+    if (planData) {
+        const plan = JSON.parse(planData);
+        document.getElementById('trip-info-banner').style.display = 'block';
+        document.getElementById('trip-destinations').textContent = 
+            `${plan.destinations.length} destinations: ${plan.destinations.map(d => d.name).join(', ')}`;
+        document.getElementById('trip-dates').textContent = 
+            `📅 ${plan.startDate} to ${plan.endDate} • 📏 ${plan.distance} • ⏱️ ${plan.duration}`;
+
+        // Pre-fill booking dates if available
+        if (plan.startDate) {
+            document.getElementById('booking-start-date').value = plan.startDate;
+        }
+        if (plan.endDate) {
+            document.getElementById('booking-end-date').value = plan.endDate;
+        }
+    }
+});
+
+function toggleService(service) {
+    const card = event.currentTarget;
+    card.classList.toggle('selected');
+
+    if (selectedServices.has(service)) {
+        selectedServices.delete(service);
+        delete selectedOptions[service];
+    } else {
+        selectedServices.add(service);
+    }
+
+    updateSummary();
+}
+
+function selectOption(category, option, price) {
+    const card = event.currentTarget;
+
+    // Remove selection from siblings
+    card.parentElement.querySelectorAll('.option-card').forEach(c => c.classList.remove('selected'));
+    card.classList.add('selected');
+
+    selectedOptions[category] = {option, price};
+    updateSummary();
+}
+
+function selectPayment(method) {
+    const card = event.currentTarget;
+    card.parentElement.querySelectorAll('.option-card').forEach(c => c.classList.remove('selected'));
+    card.classList.add('selected');
+}
+
+function updateSummary() {
+    const travelers = parseInt(document.getElementById('num-travelers')?.value || 1);
+    let html = '';
+    let total = 0;
+
+    if (Object.keys(selectedOptions).length === 0) {
+        html = '<p style="text-align: center; color: var(--text-secondary); padding: 2rem 0;">Select services to see pricing</p>';
+    } else {
+        for (const [service, data] of Object.entries(selectedOptions)) {
+            const amount = data.price * travelers;
+            total += amount;
+
+            const serviceNames = {
+                flight: '✈️ Flight',
+                hotel: '🏨 Hotel',
+                cab: '🚗 Cab',
+                tickets: '🎫 Tickets',
+                guide: '👨‍🏫 Guide'
+            };
+
+            html += `
+                <div class="summary-item">
+                    <span>${serviceNames[service]}</span>
+                    <strong>₹${amount.toLocaleString()}</strong>
+                </div>
+            `;
+        }
+
+        const gst = Math.round(total * 0.18);
+        html += `
+            <div class="summary-item">
+                <span>GST (18%)</span>
+                <strong>₹${gst.toLocaleString()}</strong>
+            </div>
+            <div class="summary-item summary-total">
+                <span>Total Amount</span>
+                <strong>₹${(total + gst).toLocaleString()}</strong>
+            </div>
+        `;
+    }
+
+    document.getElementById('summary-content').innerHTML = html;
+    totalAmount = total;
+}
+
+function nextStep() {
+    if (currentStep === 1 && selectedServices.size === 0) {
+        alert('⚠️ Please select at least one service');
+        return;
+    }
+
+    if (currentStep === 1) {
+        // Show options for selected services
+        document.querySelectorAll('[id$="-options"]').forEach(el => el.style.display = 'none');
+        selectedServices.forEach(service => {
+            const optionsEl = document.getElementById(service + 's-options') || 
+                             document.getElementById(service + '-options');
+            if (optionsEl) optionsEl.style.display = 'block';
+        });
+    }
+
+    if (currentStep === 2 && Object.keys(selectedOptions).length === 0) {
+        alert('⚠️ Please select at least one option');
+        return;
+    }
+
+    if (currentStep < 4) {
+        currentStep++;
+        updateWizard();
+    }
+}
+
+function previousStep() {
+    if (currentStep > 1) {
+        currentStep--;
+        updateWizard();
+    }
+}
+
+function updateWizard() {
+    // Update steps
+    document.querySelectorAll('.wizard-step').forEach((step, index) => {
+        step.classList.remove('active', 'completed');
+        if (index + 1 === currentStep) {
+            step.classList.add('active');
+        } else if (index + 1 < currentStep) {
+            step.classList.add('completed');
+        }
+    });
+
+    // Update content
+    document.querySelectorAll('.wizard-content').forEach(content => {
+        content.classList.remove('active');
+    });
+    document.querySelector(`.wizard-content[data-step="${currentStep}"]`).classList.add('active');
+
+    // Update buttons
+    document.getElementById('prev-btn').style.display = currentStep > 1 ? 'block' : 'none';
+    document.getElementById('next-btn').style.display = currentStep < 4 ? 'block' : 'none';
+    document.getElementById('finish-btn').style.display = currentStep === 4 ? 'block' : 'none';
+}
+
+async function completeBooking() {
+    const name = document.getElementById('traveler-name').value;
+    const email = document.getElementById('traveler-email').value;
+    const phone = document.getElementById('traveler-phone').value;
+    const startDate = document.getElementById('booking-start-date').value;
+    const endDate = document.getElementById('booking-end-date').value;
+
+    if (!name || !email || !phone || !startDate || !endDate) {
+        alert('⚠️ Please fill in all required fields');
+        return;
+    }
+
+    // Get selected payment method
+    const paymentCard = document.querySelector('.option-card.selected');
+    const paymentMethod = paymentCard ? (paymentCard.textContent.includes('UPI') ? 'upi' : 
+                                          paymentCard.textContent.includes('Net Banking') ? 'netbanking' : 'card') : 'card';
+
+    // Bookings are attributed to the first stop of the planned trip
+    const planData = JSON.parse(sessionStorage.getItem('tripPlan') || 'null');
+    const firstStop = planData && planData.destinations && planData.destinations[0];
+
+    const bookingData = {
+        destination_id: firstStop ? firstStop.id : null,
+        services: Array.from(selectedServices),
+        options: selectedOptions,
+        traveler: {name, email, phone},
+        travelers: parseInt(document.getElementById('num-travelers').value),
+        startDate: startDate,
+        endDate: endDate,
+        specialRequirements: document.getElementById('special-requirements').value,
+        paymentMethod: paymentMethod
+    };
+
+    // Show loading state
+    const finishBtn = document.getElementById('finish-btn');
+    const originalText = finishBtn.textContent;
+    finishBtn.disabled = true;
+    finishBtn.textContent = 'Processing...';
+
+    try {
+
+        const response = await fetch('/api/bookings', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify(bookingData)
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            const totalWithGST = (totalAmount * 1.18).toLocaleString();
+            alert(`✅ Booking Confirmed!\n\nBooking ID: #${data.booking_id}\nTotal Amount: ₹${totalWithGST}\n\nConfirmation sent to ${email}`);
+
+            // Redirect to dashboard or bookings page
+            window.location.href = '/dashboard';
+        } else {
+            alert(`❌ Booking Failed!\n\n${data.message || 'An error occurred. Please try again.'}`);
+            finishBtn.disabled = false;
+            finishBtn.textContent = originalText;
+        }
+    } catch (error) {
+        console.error('Booking error:', error);
+        alert('❌ An error occurred while processing your booking. Please try again.');
+        finishBtn.disabled = false;
+        finishBtn.textContent = originalText;
+    }
+}
+
+// Initialize
+updateSummary();
@@ -0,0 +1,74 @@
+async function sendMessage() {
+    const input = document.getElementById('chat-input');
+    const message = input.value.trim();
+
+    if (!message) return;
+
+    const chatMessages = document.getElementById('chat-messages');
+
+    // Add user message
+    chatMessages.innerHTML += `
+        <div class="message user-message">
+            <p>${message}</p>
+        </div>
+    `;
+
+    input.value = '';
+    chatMessages.scrollTop = chatMessages.scrollHeight;
+
+    // Get bot response
+    try {
+        const response = await fetch('/api/chatbot', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({message})
+        });
+
+        const data = await response.json();
+
+        chatMessages.innerHTML += `
+            <div class="message bot-message">
+                <p>${data.response}</p>
+            </div>
+        `;
+
+        chatMessages.scrollTop = chatMessages.scrollHeight;
+    } catch (error) {
+        console.error('Chatbot error:', error);
+    }
+}
+
+function handleChatEnter(event) {
+    if (event.key === 'Enter') {
+        sendMessage();
+    }
+}
+
+async function loadDashboardData() {
+    try {
+        const response = await fetch('/api/recommendations?limit=6');
+        const destinations = await response.json();
+
+        const grid = document.getElementById('recommendations-grid');
+        grid.innerHTML = destinations.slice(0, 6).map(dest => `
+            <div class="recommendation-card">
+                <img src="${dest.image_url}" alt="${dest.name}">
+                <div class="rec-info">
+                    <h3>${dest.name}</h3>
+                    <p>${dest.category}</p>
+                    <span class="rating">⭐ ${dest.rating}</span>
+                </div>
+            </div>
+        `).join('');
+
+        // Load bookings count
+        const bookingsResponse = await fetch('/api/bookings/my');
+        const bookings = await bookingsResponse.json();
+        document.getElementById('bookings-count').textContent = bookings.length;
+
+    } catch (error) {
+        console.error('Error loading dashboard:', error);
+    }
+}
+
+loadDashboardData();
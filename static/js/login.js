@@ -0,0 +1,84 @@
+function showTab(tab) {
+    const loginForm = document.getElementById('login-form');
+    const signupForm = document.getElementById('signup-form');
+    const tabs = document.querySelectorAll('.tab-btn');
+
+    tabs.forEach(t => t.classList.remove('active'));
+
+    if (tab === 'login') {
+        loginForm.style.display = 'block';
+        signupForm.style.display = 'none';
+        tabs[0].classList.add('active');
+    } else {
+        loginForm.style.display = 'none';
+        signupForm.style.display = 'block';
+        tabs[1].classList.add('active');
+    }
+}
+
+function showMessage(text, type = 'error') {
+    const msg = document.getElementById('message');
+    msg.textContent = text;
+    msg.className = `message message-${type}`;
+    msg.style.display = 'block';
+    setTimeout(() => msg.style.display = 'none', 5000);
+}
+
+async function handleLogin(e) {
+    e.preventDefault();
+
+    const email = document.getElementById('login-email').value;
+    const password = document.getElementById('login-password').value;
+
+    try {
+        const response = await fetch('/login', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({email, password})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Login successful! Redirecting...', 'success');
+            setTimeout(() => window.location.href = '/home', 1000);
+        } else {
+            showMessage(data.message);
+        }
+    } catch (error) {
+        showMessage('An error occurred. Please try again.');
+    }
+}
+
+async function handleSignup(e) {
+    e.preventDefault();
+
+    const username = document.getElementById('signup-username').value;
+    const email = document.getElementById('signup-email').value;
+    const password = document.getElementById('signup-password').value;
+    const confirm = document.getElementById('signup-confirm').value;
+
+    if (password !== confirm) {
+        showMessage('Passwords do not match!');
+        return;
+    }
+
+    try {
+        const response = await fetch('/signup', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({username, email, password})
+        });
+
+        const data = await response.json();
+
+        if (data.success) {
+            showMessage('Account created! Please login.', 'success');
+            setTimeout(() => showTab('login'), 1500);
+        } else {
+            showMessage(data.message);
+        }
+    } catch (error) {
+        showMessage('An error occurred. Please try again.');
+    }
+}
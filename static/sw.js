@@ -1,19 +1,21 @@
-/* NAVIGo service worker (minimal offline support) */
-const CACHE_NAME = 'navigo-v1';
-
-const PRECACHE_URLS = [
-  '/',
-  '/login',
-  '/static/css/style.css',
-  '/static/js/main.js',
-  '/static/manifest.webmanifest',
-  '/static/icons/icon-192.png',
-  '/static/icons/icon-512.png'
-];
+/* NAVIGo service worker (offline support + API caching) */
+const ASSET_VERSION = '__ASSET_VERSION__';
+const CACHE_NAME = `navigo-${ASSET_VERSION}`;
+// API responses roll over with each deploy, since response shapes may change
+const API_CACHE = `navigo-api-${ASSET_VERSION}`;
+const FETCHED_AT_HEADER = 'x-sw-fetched-at';
+// Bound the API cache: query variants beyond this are evicted oldest-first,
+// and entries older than the max stale age are refetched instead of served
+const API_MAX_ENTRIES = 100;
+const API_MAX_STALE_MS = 24 * 60 * 60 * 1000;
 
 self.addEventListener('install', (event) => {
+  // Precache list comes from the backend: content-hashed URLs of files that exist
   event.waitUntil(
-    caches.open(CACHE_NAME).then((cache) => cache.addAll(PRECACHE_URLS)).then(() => self.skipWaiting())
+    fetch('/asset-manifest.json', { cache: 'no-store' })
+      .then((resp) => resp.json())
+      .then((manifest) => caches.open(CACHE_NAME).then((cache) => cache.addAll(manifest.precache)))
+      .then(() => self.skipWaiting())
   );
 });
 
@@ -22,7 +24,7 @@ self.addEventListener('activate', (event) => {
     caches.keys().then((keys) =>
       Promise.all(
         keys.map((key) => {
-          if (key !== CACHE_NAME) return caches.delete(key);
+          if (key !== CACHE_NAME && key !== API_CACHE) return caches.delete(key);
           return undefined;
         })
       )
@@ -30,6 +32,46 @@ self.addEventListener('activate', (event) => {
   );
 });
 
+function maxAgeOf(resp) {
+  const cacheControl = resp.headers.get('Cache-Control') || '';
+  const match = cacheControl.match(/max-age=(\d+)/);
+  return match ? parseInt(match[1], 10) : 0;
+}
+
+function ageOf(resp) {
+  return Date.now() - parseInt(resp.headers.get(FETCHED_AT_HEADER) || '0', 10);
+}
+
+function isFresh(resp) {
+  return ageOf(resp) < maxAgeOf(resp) * 1000;
+}
+
+// Cache keys come back in insertion order, so the first ones are the oldest
+function trimApiCache(cache) {
+  return cache.keys().then((keys) =>
+    Promise.all(keys.slice(0, Math.max(0, keys.length - API_MAX_ENTRIES)).map((key) => cache.delete(key)))
+  );
+}
+
+// Fetch from network and store a timestamped copy if the server marked it cacheable
+function fetchAndCacheApi(req) {
+  return fetch(req).then((resp) => {
+    if (resp.ok && maxAgeOf(resp) > 0) {
+      const copy = resp.clone();
+      copy.blob().then((body) => {
+        const headers = new Headers(copy.headers);
+        headers.set(FETCHED_AT_HEADER, String(Date.now()));
+        return caches.open(API_CACHE).then((cache) =>
+          cache.delete(req)
+            .then(() => cache.put(req, new Response(body, { status: copy.status, statusText: copy.statusText, headers })))
+            .then(() => trimApiCache(cache))
+        );
+      });
+    }
+    return resp;
+  });
+}
+
 self.addEventListener('fetch', (event) => {
   const req = event.request;
   const url = new URL(req.url);
@@ -37,20 +79,32 @@ self.addEventListener('fetch', (event) => {
   // Only handle same-origin GET requests
   if (req.method !== 'GET' || url.origin !== self.location.origin) return;
 
-  // Network-first for API calls (keep UI responsive with fresh data)
+  // API: stale-while-revalidate, governed by the server's max-age
   if (url.pathname.startsWith('/api/')) {
     event.respondWith(
-      fetch(req).catch(() => caches.match(req))
+      caches.open(API_CACHE).then((cache) => cache.match(req)).then((cached) => {
+        if (!cached) return fetchAndCacheApi(req);
+        // Too old to show even briefly: go to the network, stale copy only if offline
+        if (ageOf(cached) > API_MAX_STALE_MS) {
+          return fetchAndCacheApi(req).catch(() => cached);
+        }
+        if (!isFresh(cached)) {
+          event.waitUntil(fetchAndCacheApi(req).catch(() => undefined));
+        }
+        return cached;
+      })
     );
     return;
   }
 
-  // Cache-first for static assets
+  // Cache-first for static assets (hashed URLs never change content)
   if (url.pathname.startsWith('/static/')) {
     event.respondWith(
       caches.match(req).then((cached) => cached || fetch(req).then((resp) => {
-        const copy = resp.clone();
-        caches.open(CACHE_NAME).then((cache) => cache.put(req, copy));
+        if (resp.ok) {
+          const copy = resp.clone();
+          caches.open(CACHE_NAME).then((cache) => cache.put(req, copy));
+        }
         return resp;
       }))
     );
@@ -62,4 +116,3 @@ self.addEventListener('fetch', (event) => {
     fetch(req).catch(() => caches.match(req).then((cached) => cached || caches.match('/')))
   );
 });
-
@@ -0,0 +1,38 @@
+"""Shared setup for tests that need the Flask app on a throwaway SQLite database"""
+
+import atexit
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_DIR = tempfile.mkdtemp(prefix='navigo-test-')
+atexit.register(shutil.rmtree, DB_DIR, True)
+
+
+def load_app():
+    """Import app.py bound to a temp database.
+
+    app.py reads its configuration at import time, so the environment is set
+    up before the first import; later calls return the same module.
+    """
+    if 'app' not in sys.modules:
+        os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(DB_DIR, 'navigo.db')
+        os.environ['INIT_DB_ON_STARTUP'] = '0'
+        os.environ['WRITE_BEHIND_PLANS'] = '0'
+        os.environ['SCORES_REFRESH_SECONDS'] = '0'
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)
+    import app as navigo
+    return navigo
+
+
+def reset_db(navigo):
+    """Drop and recreate every table (only ever on the temp database)"""
+    if DB_DIR not in navigo.app.config['SQLALCHEMY_DATABASE_URI']:
+        raise RuntimeError('app is not bound to the test database')
+    with navigo.app.app_context():
+        navigo.db.session.remove()
+        navigo.db.drop_all()
+        navigo.db.create_all()
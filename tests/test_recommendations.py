@@ -0,0 +1,141 @@
+"""Recommendation scoring (recommendations.py) and the /api/recommendations limit"""
+
+import json
+import unittest
+
+import numpy as np
+
+from app_helpers import load_app, reset_db
+
+navigo = load_app()
+import recommendations
+from recommendations import Catalogue, build_profile, parse_preferences, recommend
+
+# (id, category, state, rating, popularity_score, popularity)
+ROWS = [
+    (1, 'Heritage', 'Rajasthan', 4.5, 0.0, 90),
+    (2, 'Heritage', 'Delhi', 4.0, 0.0, 80),
+    (3, 'Beach', 'Goa', 4.2, 0.0, 70),
+    (4, 'Beach', 'Kerala', 3.8, 0.0, 60),
+    (5, 'Hill Station', 'Himachal Pradesh', 4.6, 0.0, 50),
+    (6, 'Wildlife', 'Rajasthan', 3.5, 0.0, 40),
+]
+
+
+class RecommendTest(unittest.TestCase):
+
+    def setUp(self):
+        self.catalogue = Catalogue(ROWS)
+
+    def ranked_ids(self, preferences=None, booked=(), reviews=(), n=10):
+        profile = build_profile(self.catalogue, preferences, list(booked), list(reviews))
+        return [dest_id for dest_id, _ in recommend(self.catalogue, profile, n, exclude_ids=booked)]
+
+    def test_booked_destinations_are_excluded(self):
+        ranked = self.ranked_ids(booked=[1, 3])
+        self.assertNotIn(1, ranked)
+        self.assertNotIn(3, ranked)
+        self.assertEqual(len(ranked), 4)
+
+    def test_duplicate_booked_ids_do_not_shrink_the_result(self):
+        ranked = self.ranked_ids(booked=[1, 1, 1, 3, 3], n=4)
+        self.assertEqual(len(ranked), 4)
+        self.assertEqual(set(ranked), {2, 4, 5, 6})
+
+    def test_unknown_booked_ids_are_ignored(self):
+        self.assertEqual(len(self.ranked_ids(booked=[999], n=10)), len(ROWS))
+
+    def test_n_larger_than_the_catalogue(self):
+        ranked = self.ranked_ids(n=100)
+        self.assertEqual(sorted(ranked), [r[0] for r in ROWS])
+        self.assertEqual(self.ranked_ids(booked=[r[0] for r in ROWS], n=100), [])
+
+    def test_results_are_best_first(self):
+        profile = build_profile(self.catalogue, None, [], [])
+        scores = [score for _, score in recommend(self.catalogue, profile, 10)]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_preferences_boost_their_category_and_state(self):
+        baseline = self.ranked_ids()
+        self.assertNotEqual(baseline[0], 4)
+
+        by_category = self.ranked_ids(json.dumps({'categories': ['Beach'], 'states': []}))
+        self.assertEqual(set(by_category[:2]), {3, 4})
+
+        by_state = self.ranked_ids(json.dumps({'categories': [], 'states': ['Kerala']}))
+        self.assertEqual(by_state[0], 4)
+
+    def test_preferences_outweigh_heavy_booking_activity(self):
+        # Many Heritage bookings are scaled to [-1, 1], so a stated preference still counts
+        booked = [1, 2] * 50
+        profile = build_profile(self.catalogue, json.dumps({'categories': ['Beach']}), booked, [])
+        cat_aff, _ = profile
+        beach = self.catalogue.categories.index('Beach')
+        heritage = self.catalogue.categories.index('Heritage')
+        self.assertAlmostEqual(float(cat_aff[heritage]), 1.0)  # normalized, not 100
+        self.assertAlmostEqual(float(cat_aff[beach]), recommendations.PREFERENCE_WEIGHT)
+
+    def test_poor_reviews_count_against_a_category(self):
+        profile = build_profile(self.catalogue, None, [], [(6, 1)])
+        cat_aff, state_aff = profile
+        self.assertLess(cat_aff[self.catalogue.categories.index('Wildlife')], 0)
+        self.assertLess(state_aff[self.catalogue.states.index('Rajasthan')], 0)
+
+    def test_empty_catalogue(self):
+        empty = Catalogue([])
+        self.assertEqual(recommend(empty, build_profile(empty, None, [1], [(1, 5)]), 5, exclude_ids=[1]), [])
+        self.assertEqual(len(empty.positions([1, 2])), 0)
+
+    def test_positions_drop_unknown_ids(self):
+        np.testing.assert_array_equal(self.catalogue.positions([6, 42, 1]), [5, 0])
+
+
+class ParsePreferencesTest(unittest.TestCase):
+
+    def test_dict_and_list_forms(self):
+        self.assertEqual(parse_preferences('{"categories": ["Beach"], "states": ["Goa"]}'), (['Beach'], ['Goa']))
+        self.assertEqual(parse_preferences('["Beach", "Goa"]'), (['Beach', 'Goa'], ['Beach', 'Goa']))
+
+    def test_bad_values_are_ignored(self):
+        self.assertEqual(parse_preferences('{"categories": [{"a": 1}, "Beach", 3], "states": "Goa"}'), (['Beach'], []))
+        self.assertEqual(parse_preferences('not json'), ([], []))
+        self.assertEqual(parse_preferences(None), ([], []))
+        self.assertEqual(parse_preferences('42'), ([], []))
+
+
+class RecommendationsEndpointTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_db(navigo)
+        navigo.recommendation_cache.clear()
+        with navigo.app.app_context():
+            navigo.db.session.add_all(
+                [navigo.Destination(id=r[0], name=f'Dest {r[0]}', category=r[1], state=r[2], rating=r[3],
+                                    popularity=r[5]) for r in ROWS]
+                + [navigo.User(id=1, username='rec', email='rec@example.com', password_hash='x')]
+            )
+            navigo.db.session.commit()
+        # Catalogue is cached per process; rebuild it for this data set
+        navigo._catalogue = None
+        self.client = navigo.app.test_client()
+        with self.client.session_transaction() as sess:
+            sess['user_id'] = 1
+
+    def count(self, query=''):
+        resp = self.client.get(f'/api/recommendations{query}')
+        self.assertEqual(resp.status_code, 200)
+        return len(resp.get_json())
+
+    def test_limit_is_clamped(self):
+        top_n = navigo.app.config['RECOMMENDATIONS_TOP_N']
+        expected = min(top_n, len(ROWS))
+        self.assertEqual(self.count(), expected)
+        self.assertEqual(self.count('?limit=2'), 2)
+        self.assertEqual(self.count('?limit=-3'), 1)
+        self.assertEqual(self.count('?limit=0'), 1)
+        self.assertEqual(self.count('?limit=100000'), expected)
+        self.assertEqual(self.count('?limit=abc'), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,177 @@
+"""Retention policies (retention.py): archive, delete, compact, dry run"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zlib
+from datetime import datetime, timedelta
+from unittest import mock
+
+from sqlalchemy import func
+
+from app_helpers import load_app, reset_db
+
+navigo = load_app()
+import retention
+from retention import RetentionPolicy, apply_policy, run_retention
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+ROUTE = {'distance_km': 412.5, 'duration_hours': 7.0, 'mode': 'driving',
+         'geometry': {'type': 'LineString', 'coordinates': [[77.2, 28.6], [78.0, 27.1]]},
+         'legs': [{'from': 1, 'to': 2}]}
+
+
+def read_archive(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+class RetentionTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_db(navigo)
+        self.archive_dir = tempfile.mkdtemp(prefix='navigo-archive-')
+        self.addCleanup(shutil.rmtree, self.archive_dir, True)
+
+        self.ctx = navigo.app.app_context()
+        self.ctx.push()
+        self.addCleanup(self.ctx.pop)
+        self.addCleanup(navigo.db.session.remove)
+
+        self.user = navigo.User(username='keeper', email='keeper@example.com', password_hash='x')
+        navigo.db.session.add(self.user)
+        navigo.db.session.commit()
+
+    def add_plans(self, ages_days, route=ROUTE):
+        plans = [navigo.TravelPlan(user_id=self.user.id, destination_ids='[1, 2]', route_data=json.dumps(route),
+                                   created_at=NOW - timedelta(days=age)) for age in ages_days]
+        navigo.db.session.add_all(plans)
+        navigo.db.session.commit()
+        return [plan.id for plan in plans]
+
+    def plan_ids(self):
+        return [row[0] for row in navigo.db.session.query(navigo.TravelPlan.id).order_by(navigo.TravelPlan.id)]
+
+    def delete_policy(self, max_age_days=30, extra_filter=None):
+        return RetentionPolicy('travel_plans', navigo.TravelPlan, navigo.TravelPlan.created_at, max_age_days,
+                               extra_filter=extra_filter)
+
+    def compact_policy(self, max_age_days=30):
+        return RetentionPolicy('travel_plan_routes', navigo.TravelPlan, navigo.TravelPlan.created_at, max_age_days,
+                               action='compact', compact_fn=navigo.compact_route_data,
+                               extra_filter=func.length(navigo.TravelPlan.route_data) > 100)
+
+    def test_old_rows_are_archived_then_deleted(self):
+        old = self.add_plans([90, 45])
+        young = self.add_plans([10, 29])
+
+        stats = apply_policy(navigo.db, self.delete_policy(), self.archive_dir, now=NOW)
+
+        self.assertEqual(stats['rows'], 2)
+        self.assertEqual(stats['cutoff'], (NOW - timedelta(days=30)).isoformat())
+        self.assertTrue(stats['archive'].endswith('travel_plans-20260601T120000.jsonl.gz'))
+        archived = read_archive(stats['archive'])
+        self.assertEqual([row['id'] for row in archived], old)
+        self.assertEqual(json.loads(archived[0]['route_data']), ROUTE)
+        self.assertEqual(archived[0]['created_at'], (NOW - timedelta(days=90)).isoformat())
+        self.assertEqual(self.plan_ids(), young)
+
+    def test_archive_is_on_disk_before_rows_are_deleted(self):
+        old = self.add_plans([90, 60])
+        real_fsync = os.fsync
+        seen = []
+
+        def check_fsync(fd):
+            real_fsync(fd)
+            # The rows must still be in the database when their archive chunk is synced
+            with navigo.db.engine.connect() as conn:
+                remaining = conn.execute(navigo.db.select(navigo.TravelPlan.id)).scalars().all()
+            with open(os.path.join(self.archive_dir, os.listdir(self.archive_dir)[0]), 'rb') as f:
+                data = zlib.decompressobj(zlib.MAX_WBITS | 16).decompress(f.read())
+            seen.append((remaining, [json.loads(line)['id'] for line in data.decode('utf-8').splitlines()]))
+
+        with mock.patch.object(retention.os, 'fsync', side_effect=check_fsync):
+            apply_policy(navigo.db, self.delete_policy(), self.archive_dir, now=NOW)
+
+        self.assertEqual(seen, [(old, old)])
+        self.assertEqual(self.plan_ids(), [])
+
+    def test_extra_filter_excludes_rows(self):
+        self.add_plans([90])
+        small = self.add_plans([90], route={'distance_km': 1.0})
+        policy = self.delete_policy(extra_filter=func.length(navigo.TravelPlan.route_data) > 100)
+
+        stats = apply_policy(navigo.db, policy, self.archive_dir, now=NOW)
+
+        self.assertEqual(stats['rows'], 1)
+        self.assertEqual(self.plan_ids(), small)
+
+    def test_compact_keeps_scalar_fields(self):
+        old = self.add_plans([90, 45])
+        young = self.add_plans([5])
+
+        stats = apply_policy(navigo.db, self.compact_policy(), self.archive_dir, now=NOW)
+
+        self.assertEqual(stats['rows'], 2)
+        self.assertEqual([json.loads(row['route_data']) for row in read_archive(stats['archive'])], [ROUTE, ROUTE])
+        navigo.db.session.expire_all()
+        self.assertEqual(self.plan_ids(), old + young)
+        for plan_id in old:
+            route = json.loads(navigo.db.session.get(navigo.TravelPlan, plan_id).route_data)
+            self.assertEqual(route, {'distance_km': 412.5, 'duration_hours': 7.0, 'mode': 'driving',
+                                     'compacted': True})
+        self.assertEqual(json.loads(navigo.db.session.get(navigo.TravelPlan, young[0]).route_data), ROUTE)
+
+        # Compacted rows fall below the size filter and are not picked again
+        again = apply_policy(navigo.db, self.compact_policy(), self.archive_dir, now=NOW + timedelta(seconds=1))
+        self.assertEqual(again['rows'], 0)
+
+    def test_dry_run_changes_nothing(self):
+        ids = self.add_plans([90, 60, 5])
+
+        for policy in (self.delete_policy(), self.compact_policy()):
+            stats = apply_policy(navigo.db, policy, self.archive_dir, chunk_size=1, dry_run=True, now=NOW)
+            self.assertEqual(stats['rows'], 2)
+            self.assertIsNone(stats['archive'])
+
+        navigo.db.session.expire_all()
+        self.assertEqual(self.plan_ids(), ids)
+        self.assertTrue(all(json.loads(navigo.db.session.get(navigo.TravelPlan, i).route_data) == ROUTE for i in ids))
+        self.assertEqual(os.listdir(self.archive_dir), [])
+
+    def test_rows_are_processed_in_chunks(self):
+        old = self.add_plans([40 + i for i in range(7)])
+        young = self.add_plans([1])
+
+        with mock.patch.object(navigo.db.session, 'commit', wraps=navigo.db.session.commit) as commit:
+            stats = apply_policy(navigo.db, self.delete_policy(), self.archive_dir, chunk_size=3, now=NOW)
+
+        self.assertEqual(stats['rows'], 7)
+        self.assertEqual(commit.call_count, 3)  # 3 + 3 + 1
+        self.assertEqual([row['id'] for row in read_archive(stats['archive'])], old)
+        self.assertEqual(self.plan_ids(), young)
+
+    def test_run_retention_skips_disabled_policies_and_vacuums(self):
+        self.add_plans([90])
+        navigo.db.session.add(navigo.Review(user_id=self.user.id, destination_id=1, rating=4,
+                                            created_at=datetime.utcnow() - timedelta(days=400)))
+        navigo.db.session.commit()
+        policies = [
+            RetentionPolicy('travel_plans', navigo.TravelPlan, navigo.TravelPlan.created_at, 0),
+            RetentionPolicy('reviews', navigo.Review, navigo.Review.created_at, 365),
+        ]
+
+        report = run_retention(navigo.db, policies, self.archive_dir, chunk_size=10)
+
+        self.assertEqual([(p['policy'], p['rows']) for p in report['policies']], [('reviews', 1)])
+        self.assertEqual(navigo.Review.query.count(), 0)
+        self.assertEqual(navigo.TravelPlan.query.count(), 1)
+        self.assertEqual(report['reclaimed_bytes'], report['size_before_bytes'] - report['size_after_bytes'])
+        self.assertIsNone(report['dead_tuples_removed'])
+
+
+if __name__ == '__main__':
+    unittest.main()
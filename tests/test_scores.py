@@ -0,0 +1,154 @@
+"""Incremental popularity / trending scores (update_scores)"""
+
+import math
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+
+from sqlalchemy import update
+
+from app_helpers import load_app, reset_db
+
+navigo = load_app()
+
+NOW = datetime(2026, 6, 1, 12, 0, 0)
+LAG = 300
+
+
+class UpdateScoresTest(unittest.TestCase):
+
+    def setUp(self):
+        reset_db(navigo)
+        self.config = mock.patch.dict(navigo.app.config, {
+            'SCORE_POPULARITY_HALF_LIFE_DAYS': 30.0,
+            'SCORE_TRENDING_HALF_LIFE_DAYS': 3.0,
+            'SCORE_BOOKING_WEIGHT': 3.0,
+            'SCORE_REVIEW_WEIGHT': 1.0,
+            'SCORE_BATCH_SIZE': 2,  # several id batches even for a few rows
+            'SCORE_WATERMARK_LAG_SECONDS': LAG,
+        })
+        self.config.start()
+        self.addCleanup(self.config.stop)
+
+        self.ctx = navigo.app.app_context()
+        self.ctx.push()
+        self.addCleanup(self.ctx.pop)
+        self.addCleanup(navigo.db.session.remove)
+
+        db = navigo.db
+        self.user = navigo.User(username='scorer', email='scorer@example.com', password_hash='x')
+        self.dest = navigo.Destination(name='Fort', category='Heritage', state='Rajasthan')
+        self.other = navigo.Destination(name='Beach', category='Beach', state='Goa')
+        db.session.add_all([self.user, self.dest, self.other])
+        db.session.commit()
+
+        self.pop_rate = math.log(2) / 30.0
+        self.trend_rate = math.log(2) / 3.0
+
+    def book(self, created_at, dest=None):
+        navigo.db.session.add(navigo.Booking(
+            user_id=self.user.id, destination_id=(dest or self.dest).id,
+            amount=1.0, total_amount=1.0, created_at=created_at
+        ))
+        navigo.db.session.commit()
+
+    def review(self, created_at, dest=None):
+        navigo.db.session.add(navigo.Review(
+            user_id=self.user.id, destination_id=(dest or self.dest).id, rating=5, created_at=created_at
+        ))
+        navigo.db.session.commit()
+
+    def scores(self, dest=None):
+        navigo.db.session.expire_all()
+        d = navigo.db.session.get(navigo.Destination, (dest or self.dest).id)
+        return d.popularity_score, d.trending_score
+
+    def expected(self, weight, age_days):
+        return weight * math.exp(-self.pop_rate * age_days), weight * math.exp(-self.trend_rate * age_days)
+
+    def test_first_run_counts_all_history(self):
+        self.book(NOW - timedelta(days=10))
+        self.book(NOW - timedelta(hours=1))
+        self.review(NOW - timedelta(days=2))
+        self.book(NOW - timedelta(days=1), dest=self.other)
+
+        stats = navigo.update_scores(now=NOW)
+
+        self.assertEqual((stats['new_bookings'], stats['new_reviews']), (3, 1))
+        parts = [self.expected(3.0, 10), self.expected(3.0, 1 / 24), self.expected(1.0, 2)]
+        pop, trend = self.scores()
+        self.assertAlmostEqual(pop, sum(p for p, _ in parts), places=9)
+        self.assertAlmostEqual(trend, sum(t for _, t in parts), places=9)
+        self.assertAlmostEqual(self.scores(self.other)[0], self.expected(3.0, 1)[0], places=9)
+
+    def test_second_run_adds_only_rows_past_the_watermark(self):
+        self.book(NOW - timedelta(days=3))
+        navigo.update_scores(now=NOW)
+        first_pop, first_trend = self.scores()
+
+        later = NOW + timedelta(days=1)
+        self.book(NOW + timedelta(hours=6))
+        stats = navigo.update_scores(now=later)
+
+        self.assertEqual(stats['new_bookings'], 1)
+        new_pop, new_trend = self.expected(3.0, 18 / 24)
+        pop, trend = self.scores()
+        self.assertAlmostEqual(pop, first_pop * math.exp(-self.pop_rate) + new_pop, places=9)
+        self.assertAlmostEqual(trend, first_trend * math.exp(-self.trend_rate) + new_trend, places=9)
+
+    def test_rows_inside_the_lag_are_held_back(self):
+        self.book(NOW - timedelta(days=1))
+        self.book(NOW - timedelta(seconds=LAG // 2))
+
+        stats = navigo.update_scores(now=NOW)
+        self.assertEqual(stats['new_bookings'], 1)
+        self.assertEqual(navigo.db.session.get(navigo.ScoreWatermark, 'destinations').last_booking_id, 1)
+
+        later = NOW + timedelta(seconds=LAG)
+        stats = navigo.update_scores(now=later)
+        self.assertEqual(stats['new_bookings'], 1)
+        pop, _ = self.scores()
+        expected = (
+            self.expected(3.0, 1)[0] * math.exp(-self.pop_rate * LAG / 86400.0)
+            + self.expected(3.0, (LAG // 2 + LAG) / 86400.0)[0]
+        )
+        self.assertAlmostEqual(pop, expected, places=9)
+
+    def test_stored_scores_decay_between_runs(self):
+        self.book(NOW - timedelta(days=1))
+        self.review(NOW - timedelta(days=1))
+        navigo.update_scores(now=NOW)
+        first_pop, first_trend = self.scores()
+
+        stats = navigo.update_scores(now=NOW + timedelta(days=5))
+
+        self.assertEqual((stats['new_bookings'], stats['new_reviews']), (0, 0))
+        self.assertAlmostEqual(stats['decayed_days'], 5.0)
+        pop, trend = self.scores()
+        self.assertAlmostEqual(pop, first_pop * math.exp(-self.pop_rate * 5), places=9)
+        self.assertAlmostEqual(trend, first_trend * math.exp(-self.trend_rate * 5), places=9)
+
+    def test_run_that_loses_the_claim_changes_nothing(self):
+        self.book(NOW - timedelta(days=1))
+        navigo.update_scores(now=NOW)
+        before = self.scores()
+        self.book(NOW + timedelta(hours=1))
+
+        settled_max_id = navigo._settled_max_id
+
+        def concurrent_run(*args):
+            # Another worker claims the watermark after this run has read it
+            with navigo.db.engine.begin() as conn:
+                conn.execute(update(navigo.ScoreWatermark).values(scored_at=NOW + timedelta(minutes=1)))
+            return settled_max_id(*args)
+
+        with mock.patch.object(navigo, '_settled_max_id', side_effect=concurrent_run):
+            self.assertIsNone(navigo.update_scores(now=NOW + timedelta(days=1)))
+
+        self.assertEqual(self.scores(), before)
+        mark = navigo.db.session.get(navigo.ScoreWatermark, 'destinations')
+        self.assertEqual(mark.last_booking_id, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,216 @@
+"""Write-behind queue: group commit, poison records and crash recovery"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import write_behind
+from write_behind import WriteBehindQueue, DEAD_LETTER_FILE, read_unacked
+
+real_sleep = time.sleep  # setUp patches time.sleep to skip the retry backoff
+
+
+class FakeStore:
+    """Stands in for the database: one 'transaction' per flush_fn call"""
+
+    def __init__(self, poison=(), down=False):
+        self.rows = {}
+        self.calls = 0
+        self.poison = set(poison)
+        self.down = down
+
+    def flush(self, records):
+        self.calls += 1
+        if self.down:
+            raise ConnectionError('database unavailable')
+        if any(r.get('n') in self.poison for r in records):
+            raise RuntimeError('bad record')
+        for r in records:
+            self.rows.setdefault(r['write_id'], r)  # replays are idempotent
+
+
+class WriteBehindQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp(prefix='navigo-wb-test-')
+        # Skip the retry backoff
+        patcher = mock.patch.object(write_behind.time, 'sleep', lambda seconds: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.dir, True)
+
+    def make_queue(self, store, **kwargs):
+        kwargs.setdefault('retry_interval', 0.01)
+        kwargs.setdefault('max_retry_interval', 0.04)
+        q = WriteBehindQueue(store.flush, self.dir, flush_interval=0.01, **kwargs)
+        self.addCleanup(q.close)
+        return q
+
+    def wait_until(self, condition, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                self.fail('condition not reached in time')
+            real_sleep(0.01)
+
+    def journals(self):
+        return sorted(n for n in os.listdir(self.dir) if n.startswith('journal-'))
+
+    def dead_letters(self):
+        path = os.path.join(self.dir, DEAD_LETTER_FILE)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return [json.loads(line)['record'] for line in f]
+
+    def write_orphan(self, entries, torn_tail=''):
+        """Journal left behind by a process that died without closing it"""
+        path = os.path.join(self.dir, 'journal-99999-deadbeef.jsonl')
+        with open(path, 'w', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+            f.write(torn_tail)
+        return path
+
+    def test_batches_are_committed_and_journal_truncated(self):
+        store = FakeStore()
+        q = self.make_queue(store, batch_size=50)
+        ids = [q.submit({'n': i}) for i in range(20)]
+
+        self.assertTrue(q.flush())
+        self.assertEqual(set(store.rows), set(ids))
+        self.assertLess(store.calls, 20)  # grouped, not one call per record
+        self.assertEqual(os.path.getsize(q._journal_path), 0)
+
+        q.close()
+        self.assertEqual(self.journals(), [])
+
+    def test_poison_record_does_not_block_its_batch(self):
+        store = FakeStore(poison={7})
+        q = self.make_queue(store, batch_size=50)
+        for i in range(20):
+            q.submit({'n': i})
+
+        self.assertFalse(q.flush())
+        self.assertEqual(sorted(r['n'] for r in store.rows.values()), [i for i in range(20) if i != 7])
+        self.assertEqual([r['n'] for r in self.dead_letters()], [7])
+        # Everything is acked, so the journal is truncated
+        self.assertEqual(q._pending, 0)
+        self.assertEqual(os.path.getsize(q._journal_path), 0)
+
+        q.submit({'n': 20})
+        self.assertTrue(q.flush())  # failures are reported once
+
+    def test_permanent_error_dead_letters_a_lone_record(self):
+        store = FakeStore()
+        store.flush = mock.Mock(side_effect=ValueError('bad date'))
+        q = self.make_queue(store, permanent_errors=(ValueError,))
+        q.submit({'n': 1})
+
+        self.assertFalse(q.flush())
+        self.assertEqual(store.flush.call_count, 1)  # not retried
+        self.assertEqual([r['n'] for r in self.dead_letters()], [1])
+        self.assertEqual(q._pending, 0)
+
+    def test_outage_records_are_retried_once_the_database_is_back(self):
+        store = FakeStore(down=True)
+        q = self.make_queue(store, batch_size=50)
+        ids = [q.submit({'n': i}) for i in range(5)]
+
+        self.assertFalse(q.flush())
+        self.assertEqual(self.dead_letters(), [])
+        self.assertEqual(q._pending, 5)
+        # Keeps retrying with capped backoff while the database is down
+        self.wait_until(lambda: q._retry_delay == q.max_retry_interval)
+        self.assertEqual(store.rows, {})
+
+        store.down = False
+        self.wait_until(lambda: len(store.rows) == 5)
+        self.assertEqual(set(store.rows), set(ids))
+        self.wait_until(lambda: q._pending == 0)
+        self.assertEqual(os.path.getsize(q._journal_path), 0)
+        self.assertTrue(q.flush())
+
+    def test_records_still_failing_at_close_are_replayed_on_the_next_start(self):
+        store = FakeStore(down=True)
+        q = self.make_queue(store, batch_size=50)
+        ids = [q.submit({'n': i}) for i in range(5)]
+
+        self.assertFalse(q.flush())
+        q.close()
+        self.assertEqual(len(self.journals()), 1)  # kept for replay
+
+        store.down = False
+        restarted = self.make_queue(store)
+        self.assertEqual(restarted.recovered, 5)
+        self.assertEqual(set(store.rows), set(ids))
+        self.assertEqual(self.journals(), [os.path.basename(restarted._journal_path)])
+
+    def test_crash_replay_skips_acked_and_already_stored_records(self):
+        store = FakeStore()
+        # w2 was committed but the process died before writing its ack
+        store.rows['w2'] = {'write_id': 'w2', 'n': 2}
+        path = self.write_orphan([
+            {'record': {'write_id': 'w1', 'n': 1}},
+            {'record': {'write_id': 'w2', 'n': 2}},
+            {'record': {'write_id': 'w3', 'n': 3}},
+            {'ack': ['w1']},
+        ], torn_tail='{"record": {"write_id": "w4"')
+
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual([r['write_id'] for r in read_unacked(f)], ['w2', 'w3'])
+
+        q = self.make_queue(store)
+        self.assertEqual(q.recovered, 2)
+        self.assertEqual(sorted(store.rows), ['w2', 'w3'])
+        self.assertFalse(os.path.exists(path))
+
+    def test_replay_dead_letters_poison_and_acks_the_rest(self):
+        store = FakeStore(poison={2})
+        path = self.write_orphan([{'record': {'write_id': f'w{i}', 'n': i}} for i in range(4)])
+
+        q = self.make_queue(store)
+        self.assertEqual(q.recovered, 3)
+        self.assertEqual(sorted(store.rows), ['w0', 'w1', 'w3'])
+        self.assertEqual([r['write_id'] for r in self.dead_letters()], ['w2'])
+        self.assertFalse(os.path.exists(path))
+
+    def test_replay_during_an_outage_is_retried_in_the_background(self):
+        path = self.write_orphan([{'record': {'write_id': f'w{i}', 'n': i}} for i in range(3)])
+
+        store = FakeStore(down=True)
+        q = self.make_queue(store, batch_size=2)
+        self.assertEqual(q.recovered, 0)
+        # Adopted into this queue's journal, so the orphan is gone
+        self.assertFalse(os.path.exists(path))
+        with open(q._journal_path, encoding='utf-8') as f:
+            self.assertEqual(len(read_unacked(f)), 3)
+
+        store.down = False
+        self.wait_until(lambda: len(store.rows) == 3)
+        self.wait_until(lambda: q._pending == 0)
+        self.assertEqual(self.dead_letters(), [])
+
+    @unittest.skipIf(write_behind.fcntl is None, 'journal locking needs fcntl')
+    def test_journal_of_a_live_process_is_left_alone(self):
+        store = FakeStore()
+        live = self.make_queue(store, batch_size=50)
+        store.down = True
+        live.submit({'n': 1})
+        live.flush()
+
+        store.down = False
+        other = self.make_queue(store)
+        self.assertEqual(other.recovered, 0)
+        self.assertTrue(os.path.exists(live._journal_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+NAVIGo - Write-behind queue
+
+Acknowledges non-critical writes immediately and persists them from a
+background thread in group commits, so a burst of saves costs one database
+transaction per batch instead of one per request.
+
+Durability:
+- Every record is appended to a local JSONL journal before it is queued, and
+  an ack line is appended once its batch commits. On startup, records without
+  an ack (from this or a dead process) are replayed.
+- Each process owns its journal through an exclusive file lock, so several
+  gunicorn workers can share one journal directory and only recover journals
+  whose owner is gone.
+- Records carry a write id; the flush callback should skip ids that are
+  already stored, which makes replay after a crash between commit and ack
+  idempotent.
+- A batch that keeps failing is retried one record at a time, so a single bad
+  record can't hold back the rest. Records that fail on their own while
+  others succeed (or with one of `permanent_errors`) are moved to
+  dead-letter.jsonl.
+- If every record fails the database is taken to be down: the records stay
+  journaled and are retried in the background with capped exponential
+  backoff until they commit.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: no journal locking, single process only
+    fcntl = None
+
+
+class QueueFull(Exception):
+    """Raised when the queue stays full for longer than the put timeout"""
+
+
+DEAD_LETTER_FILE = 'dead-letter.jsonl'
+
+
+class WriteBehindQueue:
+    """Bounded queue flushed in batches by a background worker.
+
+    flush_fn(records) must persist the whole batch in one transaction and
+    raise on failure; records are plain JSON-serializable dicts with a
+    'write_id' key. permanent_errors are exception types that mean the record
+    itself is bad (not the database), so it is dead-lettered straight away.
+    Records that fail while the database is down are retried after
+    retry_interval seconds, doubling up to max_retry_interval.
+    """
+
+    def __init__(self, flush_fn, journal_dir, max_size=1000, batch_size=200,
+                 flush_interval=0.05, put_timeout=1.0, fsync=False, permanent_errors=(),
+                 retry_interval=1.0, max_retry_interval=60.0):
+        self.flush_fn = flush_fn
+        self.journal_dir = journal_dir
+        self.permanent_errors = tuple(permanent_errors)
+        self.dead_letter_path = os.path.join(journal_dir, DEAD_LETTER_FILE)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.fsync = fsync
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+
+        self._queue = queue.Queue(maxsize=max_size)
+        self._journal_lock = threading.Lock()
+        self._pending = 0
+        self._failed = 0  # records not committed since the last flush()
+        self._retry = []  # journaled records waiting for the database (worker only)
+        self._retry_delay = retry_interval
+        self._retry_at = 0.0
+        self._closed = False
+
+        os.makedirs(journal_dir, exist_ok=True)
+        self._journal_path = os.path.join(journal_dir, f"journal-{os.getpid()}-{uuid.uuid4().hex[:8]}.jsonl")
+        self._journal = open(self._journal_path, 'a+', encoding='utf-8')
+        if fcntl is not None:
+            fcntl.flock(self._journal.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+        self.recovered = self._recover_orphans()
+
+        self._worker = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    # Public API
+
+    def submit(self, record):
+        """Journal and enqueue a record; returns its write id.
+
+        Blocks up to put_timeout while the queue is full, then raises
+        QueueFull so the caller can fall back to a synchronous write.
+        """
+        if self._closed:
+            raise QueueFull('write-behind queue is closed')
+        record = dict(record)
+        record.setdefault('write_id', uuid.uuid4().hex)
+
+        deadline = time.monotonic() + self.put_timeout
+        while True:
+            # Enqueue and journal under one lock so the record line always
+            # precedes its ack line in the journal
+            with self._journal_lock:
+                try:
+                    self._queue.put_nowait(record)
+                except queue.Full:
+                    pass
+                else:
+                    self._pending += 1
+                    self._append({'record': record})
+                    return record['write_id']
+            if time.monotonic() >= deadline:
+                raise QueueFull('write-behind queue is full')
+            time.sleep(0.005)
+
+    def flush(self, timeout=None):
+        """Block until everything submitted so far has been written.
+
+        Returns True if it was all committed; False on timeout, if any
+        record since the previous flush() was dead-lettered, or while records
+        are waiting to be retried. Retries are not waited for.
+        """
+        if timeout is None:
+            self._queue.join()
+            finished = True
+        else:
+            finished = self._join(timeout)
+        with self._journal_lock:
+            failed, self._failed = self._failed, 0
+        return finished and not failed and not self._retry
+
+    def close(self):
+        """Stop accepting writes, flush what is queued and stop the worker"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+        with self._journal_lock:
+            if self._pending == 0:
+                self._journal.close()
+                os.remove(self._journal_path)
+            else:
+                # Records the database never took stay in the journal for the next start
+                self._journal.close()
+
+    def qsize(self):
+        return self._queue.qsize()
+
+    # Worker
+
+    def _run(self):
+        stop = False
+        while not stop:
+            try:
+                item = self._queue.get(timeout=self._retry_wait())
+            except queue.Empty:
+                self._retry_kept()
+                continue
+            if item is None:
+                self._queue.task_done()
+                break
+            batch = [item]
+            # Group commit: gather whatever else arrives within the interval
+            while len(batch) < self.batch_size:
+                try:
+                    nxt = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    self._queue.task_done()
+                    stop = True
+                    break
+                batch.append(nxt)
+            self._flush_batch(batch)
+            for _ in batch:
+                self._queue.task_done()
+            # Don't let steady traffic starve the retries
+            if self._retry and time.monotonic() >= self._retry_at:
+                self._retry_kept()
+        if self._retry:
+            self._retry_kept()  # last chance before close()
+
+    def _flush_batch(self, batch):
+        committed, dead, kept = self._persist(batch)
+        with self._journal_lock:
+            self._failed += len(batch) - len(committed)
+        self._ack(committed + dead)
+        if kept:
+            self._schedule_retry(kept)
+
+    def _ack(self, records):
+        if not records:
+            return
+        with self._journal_lock:
+            self._append({'ack': [r['write_id'] for r in records]})
+            self._pending -= len(records)
+            if self._pending == 0:
+                self._journal.seek(0)
+                self._journal.truncate()
+
+    def _retry_wait(self):
+        """Queue wait before the next retry is due; None blocks until a submit"""
+        if not self._retry:
+            return None
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def _schedule_retry(self, records):
+        if not self._retry:
+            self._retry_delay = self.retry_interval
+        self._retry.extend(records)
+        self._retry_at = time.monotonic() + self._retry_delay
+
+    def _retry_kept(self):
+        """Retry records kept while the database was down, one batch at a time.
+
+        Stops at the first batch that still fails entirely and backs off.
+        """
+        while self._retry:
+            batch = self._retry[:self.batch_size]
+            committed, dead, kept = self._persist(batch, attempts=1)
+            self._ack(committed + dead)
+            if kept:
+                self._retry = kept + self._retry[len(batch):]
+                self._retry_delay = min(self._retry_delay * 2, self.max_retry_interval)
+                self._retry_at = time.monotonic() + self._retry_delay
+                return
+            del self._retry[:len(batch)]
+            self._retry_delay = self.retry_interval
+
+    def _persist(self, records, attempts=3):
+        """Flush records; returns (committed, dead_lettered, kept) lists.
+
+        Committed and dead-lettered records can be acked; kept records failed
+        in a way that looks like the database, not the record, and stay in
+        the journal.
+        """
+        error = None
+        for attempt in range(attempts):
+            try:
+                self.flush_fn(records)
+                return records, [], []
+            except self.permanent_errors as e:
+                error = e
+                break  # retrying the same batch won't help; isolate the bad record
+            except Exception as e:
+                error = e
+                if attempt < attempts - 1:
+                    time.sleep(0.5 * (attempt + 1))
+
+        if len(records) == 1:
+            failures = [(records[0], error)]
+            committed = []
+        else:
+            committed, failures = [], []
+            for record in records:
+                try:
+                    self.flush_fn([record])
+                    committed.append(record)
+                except Exception as e:
+                    failures.append((record, e))
+
+        dead, kept = [], []
+        for record, e in failures:
+            # A record that fails while its neighbours commit is the problem itself
+            if committed or isinstance(e, self.permanent_errors):
+                dead.append((record, e))
+            else:
+                kept.append(record)
+        if dead:
+            self._dead_letter(dead)
+        if kept:
+            print(f"Write-behind flush error ({len(kept)} records kept in journal for retry): {error}")
+        return committed, [record for record, _ in dead], kept
+
+    def _dead_letter(self, failures):
+        """Append records that can't be persisted to the shared dead-letter file"""
+        lines = ''.join(
+            json.dumps({'record': record, 'error': repr(e), 'failed_at': time.time()}, separators=(',', ':')) + '\n'
+            for record, e in failures
+        )
+        with open(self.dead_letter_path, 'a', encoding='utf-8') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        print(f"Write-behind: moved {len(failures)} records to {self.dead_letter_path}: {failures[0][1]}")
+
+    def _join(self, timeout):
+        done = threading.Event()
+        threading.Thread(target=lambda: (self._queue.join(), done.set()), daemon=True).start()
+        return done.wait(timeout)
+
+    # Journal
+
+    def _append(self, entry):
+        self._journal.write(json.dumps(entry, separators=(',', ':')) + '\n')
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+
+    def _recover_orphans(self):
+        """Replay un-acked records from journals whose owning process is gone"""
+        recovered = 0
+        for name in sorted(os.listdir(self.journal_dir)):
+            path = os.path.join(self.journal_dir, name)
+            if path == self._journal_path or not (name.startswith('journal-') and name.endswith('.jsonl')):
+                continue
+            try:
+                f = open(path, 'r+', encoding='utf-8')
+            except OSError:
+                continue
+            with f:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        continue  # still owned by a live process
+                records = read_unacked(f)
+                for start in range(0, len(records), self.batch_size):
+                    if self._retry:
+                        # Database is down: don't try the rest, retry them with the others
+                        self._adopt(records[start:])
+                        break
+                    committed, dead, kept = self._persist(records[start:start + self.batch_size])
+                    if committed or dead:
+                        # Ack in the orphan journal so a crash mid-recovery doesn't redo them
+                        f.seek(0, os.SEEK_END)
+                        f.write(json.dumps({'ack': [r['write_id'] for r in committed + dead]}, separators=(',', ':')) + '\n')
+                        f.flush()
+                    recovered += len(committed)
+                    self._adopt(kept)
+                if self._retry:
+                    print(f"Write-behind recovery of {name}: database unavailable, retrying in the background")
+            os.remove(path)
+        return recovered
+
+    def _adopt(self, records):
+        """Move records from an orphan journal into this queue's journal and retry list"""
+        if not records:
+            return
+        with self._journal_lock:
+            for record in records:
+                self._append({'record': record})
+            self._pending += len(records)
+        self._schedule_retry(records)
+
+
+def read_unacked(f):
+    """Records in a journal file that were never acknowledged"""
+    records = {}
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # torn final line from a crash mid-write
+        if 'record' in entry:
+            records[entry['record']['write_id']] = entry['record']
+        for write_id in entry.get('ack', []):
+            records.pop(write_id, None)
+    return list(records.values())